@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models import Q
 from .models import CustomUser
 
 # Registers models in admin panel
@@ -9,6 +10,9 @@ class CustomUserAdmin(BaseUserAdmin):
     list_filter = ['auth_provider', 'is_email_verified', 'is_active', 'soft_deleted', 'created_at']
     search_fields = ['email', 'first_name', 'last_name', 'username']
     ordering = ['-created_at']
+    list_per_page = 50
+    # skip the second unfiltered COUNT(*) the changelist runs on every page
+    show_full_result_count = False
     
     fieldsets = (
         ('Authentication', {
@@ -38,10 +42,34 @@ class CustomUserAdmin(BaseUserAdmin):
     )
     
     readonly_fields = ['id', 'created_at', 'updated_at', 'last_login']
+    actions = ['soft_delete_users']
+    
+    @admin.action(description='Soft delete selected users')
+    def soft_delete_users(self, request, queryset):
+        """one UPDATE for the whole selection; the acting admin is never included"""
+        ids = queryset.exclude(pk=request.user.pk).values_list('pk', flat=True)
+        updated = CustomUser.objects.bulk_soft_delete(ids)
+        self.message_user(request, f'{updated} user(s) soft deleted.')
+    
+    def get_search_results(self, request, queryset, search_term):
+        """
+        narrow the search instead of OR-ing %term% across four columns:
+        an email-looking term is an exact (case-insensitive) email match, anything else a name prefix
+        """
+        term = search_term.strip()
+        if not term:
+            return super().get_search_results(request, queryset, search_term)
+        if '@' in term:
+            return queryset.filter(email__iexact=term), False
+        return queryset.filter(Q(first_name__istartswith=term) | Q(last_name__istartswith=term)), False
     
     def get_queryset(self, request):
-        """Filter out soft deleted users by default"""
-        return super().get_queryset(request).filter(soft_deleted=False)
+        """admin sees every account, soft deleted included — narrow with the soft_deleted list filter"""
+        queryset = self.model.all_objects.get_queryset()
+        ordering = self.get_ordering(request)
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return queryset
 
 
 admin.site.register(CustomUser, CustomUserAdmin)
\ No newline at end of file
@@ -0,0 +1,34 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db.models.functions import Lower
+
+
+class EmailBackend(ModelBackend):
+    """
+    email/password login — authenticate(username=email, password=...) matches the email column
+    case-insensitively instead of the username column.
+
+    the lookup compares lower(email), the same expression as users_email_lower_uniq, so it is an
+    index probe. (email__iexact compiles to UPPER(...) on postgres and would miss that index.)
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get('email')
+        if username is None or password is None:
+            return None
+
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.alias(email_lower=Lower('email')).get(
+                email_lower=username.lower()
+            )
+        except (UserModel.DoesNotExist, UserModel.MultipleObjectsReturned):
+            # run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user (same as ModelBackend)
+            UserModel().set_password(password)
+            return None
+
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
@@ -1,9 +1,94 @@
+import copy
+from functools import cached_property
+
 from django.db import models
-from django.contrib.auth.models import AbstractUser
-from django.core.validators import EmailValidator
+from django.utils import timezone
+from django.db.models.functions import Concat, Lower, Trim
+from django.contrib.auth.models import AbstractUser, UserManager
 import uuid
 
 
+# defaults every new account starts with — module constant so it is built once, copied per user
+_DEFAULT_PREFERENCES = {
+    'theme': 'light',
+    'notifications': {
+        'enabled': True,
+        'due_date_reminders': True,
+        'routine_reminders': True,
+        'push_notifications': True,
+    },
+    'default_priority': 3,
+    'default_color': 'blue',
+    'default_list_view': 'list',
+    'timezone': 'UTC',
+    'date_format': 'MM/DD/YYYY',
+    'time_format': '12h',
+    # local day-planning window used by planner timeline (24h hh:mm strings)
+    'wake_time': '06:00',
+    'sleep_time': '23:00',
+}
+
+
+def _default_preferences_factory():
+    """field default for CustomUser.preferences — deep copy so users never share the nested dicts"""
+    return copy.deepcopy(_DEFAULT_PREFERENCES)
+
+
+class CustomUserQuerySet(models.QuerySet):
+    """queryset helpers for user listings"""
+
+    def with_profile_annotations(self):
+        """
+        compute full_name / is_social_user in sql once per query instead of a python call per row
+        full_name matches get_full_name(): 'first last', or whichever half is set, or ''
+        """
+        return self.annotate(
+            full_name=Trim(Concat('first_name', models.Value(' '), 'last_name', output_field=models.CharField())),
+            is_social_user_db=models.ExpressionWrapper(
+                ~models.Q(auth_provider='email'),
+                output_field=models.BooleanField(),
+            ),
+        )
+
+    def bulk_register(self, emails_and_names, password_hash, batch_size=1000):
+        """
+        create email/password accounts in batched INSERTs for imports / fixtures.
+        emails_and_names yields (email, first_name, last_name); password_hash comes from make_password().
+        bulk_create skips save(); email users need no username and preferences come from the field default.
+        existing emails are skipped (ignore_conflicts), so re-running an import is safe.
+        """
+        users = [
+            self.model(
+                email=email,
+                auth_provider='email',
+                first_name=first_name,
+                last_name=last_name,
+                password=password_hash,
+            )
+            for email, first_name, last_name in emails_and_names
+        ]
+        return self.bulk_create(users, batch_size=batch_size, ignore_conflicts=True)
+
+    def bulk_soft_delete(self, ids):
+        """soft delete + deactivate many accounts with one UPDATE; returns the number of rows changed"""
+        # update() bypasses auto_now, so updated_at is set explicitly
+        return self.filter(id__in=ids).update(soft_deleted=True, is_active=False, updated_at=timezone.now())
+
+
+class CustomUserManager(UserManager.from_queryset(CustomUserQuerySet)):
+    """django's UserManager (create_user etc.) plus the CustomUserQuerySet helpers"""
+
+
+class LiveUserManager(CustomUserManager):
+    """
+    default manager — soft deleted accounts never leave the database.
+    authenticate(), jwt user lookup and every view go through this, so the filter can't be forgotten.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(soft_deleted=False)
+
+
 class CustomUser(AbstractUser):
     """
     enhanced CustomUser model with social authentication support
@@ -13,9 +98,9 @@ class CustomUser(AbstractUser):
     # basic user information
     # UUID provides secure, non-sequential user IDs that don't reveal database size
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # EmailField already carries django's validate_email — no extra EmailValidator instance
     email = models.EmailField(
         unique=True,
-        validators=[EmailValidator()],
         help_text="User's email address (required and unique)"
     )
     
@@ -60,7 +145,7 @@ class CustomUser(AbstractUser):
     
     # user preferences (JSON field for flexibility)
     preferences = models.JSONField(
-        default=dict,
+        default=_default_preferences_factory,
         blank=True,
         help_text="User preferences and app settings"
     )
@@ -92,6 +177,10 @@ class CustomUser(AbstractUser):
         help_text="Password hash (optional for social auth users)"
     )
     
+    # objects hides soft deleted users; all_objects is for admin / account-conflict checks
+    objects = LiveUserManager()
+    all_objects = CustomUserManager()
+    
     class Meta:
         # custom database table name instead of default app_model format
         db_table = 'users'
@@ -100,34 +189,68 @@ class CustomUser(AbstractUser):
         # plural name for admin interface
         verbose_name_plural = 'Users'
         # creates a separate, sorted lookup table for each field that points back to the main table rows
+        # email has no plain entry here: unique=True already gives it a b-tree, a second one only slows writes
         indexes = [
-            # speeds up login lookups and email uniqueness checks
-            models.Index(fields=['email']),
-            # speeds up social auth lookups (google/apple/facebook user matching)
-            models.Index(fields=['auth_provider', 'auth_provider_id']),
-            # speeds up filtering verified vs unverified users
-            models.Index(fields=['is_email_verified']),
-            # speeds up soft delete queries (active vs deleted users)
-            models.Index(fields=['soft_deleted']),
-            # speeds up user creation date sorting and filtering
-            models.Index(fields=['created_at']),
+            # unverified users only (admin is_email_verified filter / ?is_verified=false) — a plain
+            # boolean index has two values and would only add write cost
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(is_email_verified=False),
+                name='users_unverified_idx',
+            ),
+            # partial index over live users only, newest first — matches the admin changelist
+            # (soft_deleted=False, ordered by -created_at) without indexing the deleted rows
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(soft_deleted=False),
+                name='users_live_by_created_idx',
+            ),
         ]
         # database-level constraints for data integrity
         constraints = [
             # prevents duplicate social auth accounts: same provider + provider_id can only exist once
             # condition ensures this only applies when auth_provider_id is not null
+            # its unique index also serves the social auth lookups (google/apple/facebook user matching)
             models.UniqueConstraint(
                 fields=['auth_provider', 'auth_provider_id'],
                 condition=models.Q(auth_provider_id__isnull=False),
                 name='unique_social_auth_provider'
             ),
+            # social accounts always carry the provider's user id — save() builds their username from it
+            models.CheckConstraint(
+                condition=models.Q(auth_provider='email') | models.Q(auth_provider_id__isnull=False),
+                name='social_auth_requires_provider_id'
+            ),
+            # one account per email regardless of case — EmailBackend matches lower(email), so
+            # Foo@x.com and foo@x.com must not both exist. doubles as the login lookup index
+            models.UniqueConstraint(Lower('email'), name='users_email_lower_uniq'),
         ]
     
+    @classmethod
+    def list_queryset(cls):
+        """
+        live users for admin listings: profile annotations plus only the listed columns,
+        so preferences json / password hash / avatar urls never leave the database
+        """
+        return cls.objects.with_profile_annotations().only(*cls.LIST_FIELDS)
+    
     def __str__(self):
-        return f"{self.email} ({self.get_full_name() or 'No Name'})"
+        return f"{self.email} ({self.full_name or self.short_name})"
     
-    def get_full_name(self):
-        """return the user's full name"""
+    # name helpers are cached per instance — serializers, __str__ and admin rows read them repeatedly.
+    # save() drops the cached values; querysets using with_profile_annotations() pre-fill full_name.
+    _CACHED_NAME_ATTRS = ('full_name', 'short_name', 'display_name', 'is_social')
+    # columns UserListSerializer reads — list_queryset() loads only these
+    LIST_FIELDS = (
+        'id', 'email', 'first_name', 'last_name', 'auth_provider', 'is_email_verified',
+        'is_active', 'soft_deleted', 'created_at', 'last_login',
+    )
+    # columns save() derives social username / password from (or writes)
+    _IDENTITY_FIELDS = frozenset({'username', 'password', 'auth_provider', 'auth_provider_id'})
+    
+    @cached_property
+    def full_name(self):
+        """the user's full name"""
         if self.first_name and self.last_name:
             return f"{self.first_name} {self.last_name}"
         elif self.first_name:
@@ -136,57 +259,62 @@ class CustomUser(AbstractUser):
             return self.last_name
         return ""
     
+    @cached_property
+    def short_name(self):
+        """the user's first name, else the local part of their email"""
+        return self.first_name or self.email.split('@', 1)[0]
+    
+    @cached_property
+    def display_name(self):
+        """display name for the user"""
+        return self.full_name or self.short_name
+    
+    @cached_property
+    def is_social(self):
+        """whether user authenticated via social provider"""
+        return self.auth_provider != 'email'
+    
+    def get_full_name(self):
+        """return the user's full name"""
+        return self.full_name
+    
     def get_short_name(self):
         """return the user's first name or email"""
-        return self.first_name or self.email.split('@')[0]
+        return self.short_name
     
     def is_social_user(self):
         """check if user authenticated via social provider"""
-        return self.auth_provider != 'email'
+        return self.is_social
     
     def get_display_name(self):
         """get display name for the user"""
-        return self.get_full_name() or self.get_short_name()
+        return self.display_name
     
     def set_default_preferences(self):
         """set default user preferences if not already sec"""
         if not self.preferences:
-            self.preferences = {
-                'theme': 'light',
-                'notifications': {
-                    'enabled': True,
-                    'due_date_reminders': True,
-                    'routine_reminders': True,
-                    'push_notifications': True,
-                },
-                'default_priority': 3,
-                'default_color': 'blue',
-                'default_list_view': 'list',
-                'timezone': 'UTC',
-                'date_format': 'MM/DD/YYYY',
-                'time_format': '12h',
-                # local day-planning window used by planner timeline (24h hh:mm strings)
-                'wake_time': '06:00',
-                'sleep_time': '23:00',
-            }
+            self.preferences = _default_preferences_factory()
     
     def save(self, *args, **kwargs):
-        """override save to set default preferences and handle social auth"""
-        # set default preferences for new users
-        if not self.pk:
-            self.set_default_preferences()
+        """override save to handle social auth usernames / passwords"""
+        # names / provider may have been edited since the cached helpers were read
+        for attr in self._CACHED_NAME_ATTRS:
+            self.__dict__.pop(attr, None)
+        
+        # narrow writes like save(update_fields=['last_login']) can't persist username/password anyway
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or not self._IDENTITY_FIELDS.isdisjoint(update_fields):
+            self._sync_identity_fields()
         
-        # Handle social auth users
+        super().save(*args, **kwargs)
+    
+    def _sync_identity_fields(self):
+        """derive username and an unusable password for social users from the auth provider"""
+        # email users log in by email (EmailBackend) — username is not mirrored from it
         if self.is_social_user():
             # Social auth users don't need username/password
             if not self.username:
                 self.username = f"{self.auth_provider}_{self.auth_provider_id}"
             if not self.password:
                 self.set_unusable_password()
-        
-        # ensure email is always set as username for email auth users
-        elif self.auth_provider == 'email' and self.email:
-            self.username = self.email
-        
-        super().save(*args, **kwargs)
 
@@ -2,10 +2,14 @@ import re
 
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from .models import CustomUser
 
+# stateless formatter for the hand-rolled to_representation below (honours REST_FRAMEWORK DATETIME_FORMAT)
+_DATETIME_FIELD = serializers.DateTimeField()
 _HH_MM_RE = re.compile(r'^([01]\d|2[0-3]):([0-5]\d)$')
 _ONBOARDING_BRANCHES = frozenset({'habit', 'task'})
 _ONBOARDING_HABIT_FREQUENCIES = frozenset({'daily', 'weekly', 'weekends'})
@@ -14,6 +18,43 @@ _DISPLAY_ORDERING_OPTIONS = frozenset({'Ascending', 'Descending'})
 _DISPLAY_LAYOUT_VIEWS = frozenset({'list', 'timeline'})
 _DISPLAY_TAB_KEYS = frozenset({'today', 'planner', 'inbox'})
 _NAVIGATION_TAB_KEYS = frozenset({'today', 'planner', 'ai', 'browse', 'inbox'})
+# allowed keys per preferences object — built once at import, checked with a set difference
+_ALLOWED_PREF_KEYS = frozenset({
+    'theme', 'notifications', 'default_priority', 'default_color',
+    'default_list_view', 'timezone', 'date_format', 'time_format',
+    'wake_time', 'sleep_time',
+    'onboarding_completed',
+    'onboarding_questionnaire',
+    'auto_archive_completed',
+    'show_completed_tasks',
+    'sort_tasks_by',
+    'display_preferences',
+    'navigation_preferences',
+    'analytics_enabled',
+    'crash_reporting_enabled',
+})
+_ALLOWED_NOTIF_KEYS = frozenset({
+    'enabled', 'due_date_reminders', 'routine_reminders', 'push_notifications',
+    'email_notifications',
+})
+_DISPLAY_TAB_PREF_KEYS = frozenset({
+    'sort_option', 'ordering_option', 'show_completed_tasks',
+    'layout_view', 'show_all_day_tasks',
+    # camelCase tolerated when clients send mixed keys
+    'sortOption', 'orderingOption', 'showCompletedTasks',
+    'layoutView', 'showAllDayTasks',
+})
+_NAVIGATION_PREF_KEYS = frozenset({'tab_order', 'pinned_tab', 'tabOrder', 'pinnedTab'})
+_ONBOARDING_TOP_KEYS = frozenset({'v', 'branch', 'completed_at', 'task', 'habit'})
+_ONBOARDING_TASK_KEYS = frozenset({'title', 'completed', 'event_time', 'duration_minutes'})
+_ONBOARDING_HABIT_KEYS = frozenset({'goal_title', 'frequency_id'})
+
+
+def _reject_unknown_keys(value, allowed, label):
+    """one set difference instead of a python loop; lists every offending key in the error"""
+    extra = value.keys() - allowed
+    if extra:
+        raise serializers.ValidationError(f'Invalid {label}: {", ".join(sorted(extra))}')
 
 
 def _validate_hh_mm_string(value):
@@ -31,16 +72,7 @@ def _validate_display_tab_preferences(value, tab_name):
     if not isinstance(value, dict):
         raise serializers.ValidationError(f'display_preferences.{tab_name} must be a JSON object')
 
-    allowed_tab_keys = {
-        'sort_option', 'ordering_option', 'show_completed_tasks',
-        'layout_view', 'show_all_day_tasks',
-        # camelCase tolerated when clients send mixed keys
-        'sortOption', 'orderingOption', 'showCompletedTasks',
-        'layoutView', 'showAllDayTasks',
-    }
-    for key in value.keys():
-        if key not in allowed_tab_keys:
-            raise serializers.ValidationError(f'Invalid display_preferences.{tab_name} key: {key}')
+    _reject_unknown_keys(value, _DISPLAY_TAB_PREF_KEYS, f'display_preferences.{tab_name} key')
 
     sort_option = value.get('sort_option', value.get('sortOption'))
     if sort_option is not None and sort_option not in _DISPLAY_SORT_OPTIONS:
@@ -70,9 +102,7 @@ def _validate_display_preferences(value):
     if not isinstance(value, dict):
         raise serializers.ValidationError('display_preferences must be a JSON object')
 
-    for key in value.keys():
-        if key not in _DISPLAY_TAB_KEYS:
-            raise serializers.ValidationError(f'Invalid display_preferences key: {key}')
+    _reject_unknown_keys(value, _DISPLAY_TAB_KEYS, 'display_preferences key')
 
     if 'today' in value:
         _validate_display_tab_preferences(value.get('today'), 'today')
@@ -89,10 +119,7 @@ def _validate_navigation_preferences(value):
     if not isinstance(value, dict):
         raise serializers.ValidationError('navigation_preferences must be a JSON object')
 
-    allowed_keys = {'tab_order', 'pinned_tab', 'tabOrder', 'pinnedTab'}
-    for key in value.keys():
-        if key not in allowed_keys:
-            raise serializers.ValidationError(f'Invalid navigation_preferences key: {key}')
+    _reject_unknown_keys(value, _NAVIGATION_PREF_KEYS, 'navigation_preferences key')
 
     tab_order = value.get('tab_order', value.get('tabOrder'))
     if tab_order is not None:
@@ -122,10 +149,7 @@ def _validate_onboarding_questionnaire(value):
     if not isinstance(value, dict):
         raise serializers.ValidationError('onboarding_questionnaire must be a JSON object')
 
-    allowed_top = {'v', 'branch', 'completed_at', 'task', 'habit'}
-    for key in value.keys():
-        if key not in allowed_top:
-            raise serializers.ValidationError(f'Invalid onboarding_questionnaire key: {key}')
+    _reject_unknown_keys(value, _ONBOARDING_TOP_KEYS, 'onboarding_questionnaire key')
 
     if value.get('v') is not None and value.get('v') != 1:
         raise serializers.ValidationError('onboarding_questionnaire v must be 1')
@@ -142,10 +166,7 @@ def _validate_onboarding_questionnaire(value):
     if task is not None:
         if not isinstance(task, dict):
             raise serializers.ValidationError('onboarding_questionnaire task must be an object or null')
-        task_keys = {'title', 'completed', 'event_time', 'duration_minutes'}
-        for key in task.keys():
-            if key not in task_keys:
-                raise serializers.ValidationError(f'Invalid onboarding_questionnaire task key: {key}')
+        _reject_unknown_keys(task, _ONBOARDING_TASK_KEYS, 'onboarding_questionnaire task key')
         if not isinstance(task.get('title', ''), str):
             raise serializers.ValidationError('task title must be a string')
         if not isinstance(task.get('completed', False), bool):
@@ -160,10 +181,7 @@ def _validate_onboarding_questionnaire(value):
     if habit is not None:
         if not isinstance(habit, dict):
             raise serializers.ValidationError('onboarding_questionnaire habit must be an object or null')
-        habit_keys = {'goal_title', 'frequency_id'}
-        for key in habit.keys():
-            if key not in habit_keys:
-                raise serializers.ValidationError(f'Invalid onboarding_questionnaire habit key: {key}')
+        _reject_unknown_keys(habit, _ONBOARDING_HABIT_KEYS, 'onboarding_questionnaire habit key')
         if not isinstance(habit.get('goal_title', ''), str):
             raise serializers.ValidationError('habit goal_title must be a string')
         frequency_id = habit.get('frequency_id')
@@ -177,35 +195,48 @@ class UserProfileSerializer(serializers.ModelSerializer):
     used for displaying user information in API responses
     """
 
-    # create new json fields for the serializer
-    full_name = serializers.SerializerMethodField()
-    display_name = serializers.SerializerMethodField()
-    is_social_user = serializers.SerializerMethodField()
+    # derived fields read straight off the cached properties on CustomUser
+    full_name = serializers.CharField(read_only=True)
+    display_name = serializers.CharField(read_only=True)
+    is_social_user = serializers.BooleanField(source='is_social', read_only=True)
     
     class Meta:
         model = CustomUser
-        fields = [
+        fields = (
             'id', 'email', 'first_name', 'last_name', 'full_name', 
             'display_name', 'avatar_url', 'auth_provider', 'is_email_verified',
             'is_social_user', 'preferences', 'created_at', 'last_login'
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'id', 'email', 'auth_provider', 'is_email_verified', 
             'created_at', 'last_login'
-        ]
-    
-    # these methods are used to return the contents for the new json fields
-    def get_full_name(self, obj):
-        """return the user's full name"""
-        return obj.get_full_name()
-    
-    def get_display_name(self, obj):
-        """return the user's display name"""
-        return obj.get_display_name()
-    
-    def get_is_social_user(self, obj):
-        """return whether user is a social auth user"""
-        return obj.is_social_user()
+        )
+
+    def to_representation(self, instance):
+        return user_profile_payload(instance)
+
+
+def user_profile_payload(user):
+    """
+    UserProfileSerializer's output built straight from attributes, skipping drf's generic field loop —
+    this shape goes out with every login, registration and profile response. keep in step with
+    UserProfileSerializer.Meta.fields.
+    """
+    return {
+        'id': str(user.id),
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'full_name': user.full_name,
+        'display_name': user.display_name,
+        'avatar_url': user.avatar_url,
+        'auth_provider': user.auth_provider,
+        'is_email_verified': user.is_email_verified,
+        'is_social_user': user.is_social,
+        'preferences': user.preferences,
+        'created_at': _DATETIME_FIELD.to_representation(user.created_at),
+        'last_login': _DATETIME_FIELD.to_representation(user.last_login),
+    }
 
 
 class UserUpdateSerializer(serializers.ModelSerializer):
@@ -216,9 +247,9 @@ class UserUpdateSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = CustomUser
-        fields = [
+        fields = (
             'first_name', 'last_name', 'avatar_url', 'preferences'
-        ]
+        )
 
     def update(self, instance, validated_data):
         """
@@ -279,24 +310,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Preferences must be a valid JSON object")
         
         # validate specific preference keys
-        allowed_keys = {
-            'theme', 'notifications', 'default_priority', 'default_color',
-            'default_list_view', 'timezone', 'date_format', 'time_format',
-            'wake_time', 'sleep_time',
-            'onboarding_completed',
-            'onboarding_questionnaire',
-            'auto_archive_completed',
-            'show_completed_tasks',
-            'sort_tasks_by',
-            'display_preferences',
-            'navigation_preferences',
-            'analytics_enabled',
-            'crash_reporting_enabled',
-        }
-        
-        for key in value.keys():
-            if key not in allowed_keys:
-                raise serializers.ValidationError(f"Invalid preference key: {key}")
+        _reject_unknown_keys(value, _ALLOWED_PREF_KEYS, 'preference key')
         
         # validate notifications structure
         if 'notifications' in value:
@@ -304,14 +318,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             if not isinstance(notifications, dict):
                 raise serializers.ValidationError("Notifications must be a valid JSON object")
             
-            allowed_notification_keys = {
-                'enabled', 'due_date_reminders', 'routine_reminders', 'push_notifications',
-                'email_notifications',
-            }
-            
-            for key in notifications.keys():
-                if key not in allowed_notification_keys:
-                    raise serializers.ValidationError(f"Invalid notification key: {key}")
+            _reject_unknown_keys(notifications, _ALLOWED_NOTIF_KEYS, 'notification key')
 
         if 'wake_time' in value:
             _validate_hh_mm_string(value.get('wake_time'))
@@ -334,6 +341,9 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     """
     serializer for user registration (email/password)
     """
+    # declared explicitly so drf doesn't attach a UniqueValidator (extra SELECT per signup);
+    # users_email_lower_uniq enforces this (case-insensitively) and create() maps the IntegrityError
+    email = serializers.EmailField(required=True, max_length=254)
     password = serializers.CharField(write_only=True, required=True, validators=[validate_password])
     password_confirm = serializers.CharField(write_only=True, required=True)
     # names optional — mobile onboarding can omit; model allows blank=True
@@ -342,19 +352,15 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = CustomUser
-        fields = [
+        fields = (
             'email', 'password', 'password_confirm', 'first_name', 'last_name'
-        ]
+        )
     
     def validate(self, attrs):
         """validate registration data"""
         if attrs['password'] != attrs['password_confirm']:
             raise serializers.ValidationError("Passwords do not match")
         
-        # check if email already exists
-        if CustomUser.objects.filter(email=attrs['email']).exists():
-            raise serializers.ValidationError("A user with this email already exists")
-        
         return attrs
     
     def create(self, validated_data):
@@ -362,16 +368,21 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         validated_data.pop('password_confirm')
         password = validated_data.pop('password')
         
-        user = CustomUser.objects.create(
+        # hashed once, up front, so the row goes in with one INSERT (no follow-up UPDATE)
+        user = CustomUser(
             email=validated_data['email'],
-            username=validated_data['email'],  # use email as username
             auth_provider='email',
+            password=make_password(password),
             first_name=validated_data.get('first_name', ''),
             last_name=validated_data.get('last_name', ''),
         )
         
-        user.set_password(password)
-        user.save()
+        # email uniqueness is left to the db constraint — savepoint keeps an outer transaction usable
+        try:
+            with transaction.atomic():
+                user.save(force_insert=True)
+        except IntegrityError:
+            raise serializers.ValidationError({'email': 'A user with this email already exists'})
         
         return user
 
@@ -403,7 +414,7 @@ class UserLoginSerializer(serializers.Serializer):
         password = attrs.get('password')
         
         if email and password:
-            # try to authenticate with email as username
+            # EmailBackend matches the email column case-insensitively
             user = authenticate(username=email, password=password)
             
             if not user:
@@ -412,9 +423,7 @@ class UserLoginSerializer(serializers.Serializer):
             if not user.is_active:
                 raise serializers.ValidationError("User account is disabled")
             
-            if user.soft_deleted:
-                raise serializers.ValidationError("User account has been deleted")
-            
+            # soft deleted users can't come back from authenticate() — the default manager excludes them
             attrs['user'] = user
             return attrs
         else:
@@ -447,13 +456,8 @@ class PasswordResetRequestSerializer(serializers.Serializer):
     """
     serializer for password reset request
     """
+    # no existence check here — the view answers the same way for unknown emails
     email = serializers.EmailField(required=True)
-    
-    def validate_email(self, value):
-        """validate email exists"""
-        if not CustomUser.objects.filter(email=value, auth_provider='email').exists():
-            raise serializers.ValidationError("No account found with this email address")
-        return value
 
 
 class PasswordResetConfirmSerializer(serializers.Serializer):
@@ -474,17 +478,15 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
 class UserListSerializer(serializers.ModelSerializer):
     """
     serializer for listing users (admin use)
+    expects a queryset built with CustomUser.objects.with_profile_annotations()
     """
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.CharField(read_only=True)
+    is_social_user = serializers.BooleanField(source='is_social_user_db', read_only=True)
     
     class Meta:
         model = CustomUser
-        fields = [
+        fields = (
             'id', 'email', 'first_name', 'last_name', 'full_name',
-            'auth_provider', 'is_email_verified', 'is_active', 'soft_deleted',
+            'auth_provider', 'is_social_user', 'is_email_verified', 'is_active', 'soft_deleted',
             'created_at', 'last_login'
-        ]
-    
-    def get_full_name(self, obj):
-        """return the user's full name"""
-        return obj.get_full_name()
\ No newline at end of file
+        )
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+tests for POST /accounts/users/<id>/deactivate/ — a single UPDATE soft deletes + deactivates,
+admins can't deactivate themselves, and already deleted users 404.
+"""
+
+from __future__ import annotations
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+
+
+def deactivate_url(user_id):
+    return f'/accounts/users/{user_id}/deactivate/'
+
+
+class UserDeactivateViewTests(TestCase):
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(
+            username='admin@example.com', email='admin@example.com', is_staff=True,
+        )
+        self.target = CustomUser.objects.create_user(username='t@example.com', email='t@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_deactivates_user(self):
+        response = self.client.post(deactivate_url(self.target.id))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('t@example.com', response.data['message'])
+        target = CustomUser.all_objects.get(pk=self.target.pk)
+        self.assertTrue(target.soft_deleted)
+        self.assertFalse(target.is_active)
+
+    def test_cannot_deactivate_self(self):
+        response = self.client.post(deactivate_url(self.admin.id))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(CustomUser.objects.filter(pk=self.admin.pk).exists())
+
+    def test_already_deleted_user_is_404(self):
+        self.client.post(deactivate_url(self.target.id))
+
+        response = self.client.post(deactivate_url(self.target.id))
+
+        self.assertEqual(response.status_code, 404)
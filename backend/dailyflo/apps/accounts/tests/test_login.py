@@ -0,0 +1,52 @@
+"""
+tests for POST /accounts/auth/login/ (simplejwt TokenObtainPairView) — the app sends the email as
+username, EmailBackend matches it against the email column case-insensitively, and soft deleted
+accounts can't sign in. ModelBackend is kept as a fallback for username-based (admin) accounts.
+"""
+
+from __future__ import annotations
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+
+LOGIN_URL = '/accounts/auth/login/'
+
+
+class UserLoginTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        # registered the way UserRegistrationSerializer does it — no username for email users
+        self.user = CustomUser(email='Ada.Lovelace@example.com', auth_provider='email')
+        self.user.set_password('a-Strong-passw0rd!')
+        self.user.save()
+
+    def _login(self, email, password='a-Strong-passw0rd!'):
+        return self.client.post(LOGIN_URL, {'username': email, 'password': password}, format='json')
+
+    def test_login_matches_email_case_insensitively(self):
+        response = self._login('ada.lovelace@EXAMPLE.com')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('access', response.data)
+
+    def test_wrong_password_is_rejected(self):
+        response = self._login(self.user.email, password='wrong')
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_soft_deleted_user_cannot_log_in(self):
+        CustomUser.objects.bulk_soft_delete([self.user.pk])
+
+        response = self._login(self.user.email)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_username_account_can_still_log_in_with_username(self):
+        # createsuperuser-style account — ModelBackend matches the username column
+        CustomUser.objects.create_user(username='admin', email='admin@example.com', password='admin-passw0rd!')
+
+        response = self._login('admin', password='admin-passw0rd!')
+
+        self.assertEqual(response.status_code, 200)
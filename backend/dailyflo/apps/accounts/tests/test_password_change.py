@@ -0,0 +1,46 @@
+"""
+tests for POST /accounts/auth/password/change/ — only the password hash (and updated_at) is written.
+"""
+
+from __future__ import annotations
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+
+CHANGE_URL = '/accounts/auth/password/change/'
+
+
+class PasswordChangeViewTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser(email='ada@example.com', auth_provider='email')
+        self.user.set_password('old-Strong-passw0rd!')
+        self.user.save()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_changes_password_without_rewriting_other_columns(self):
+        # a concurrent edit to another column must survive the password write
+        CustomUser.objects.filter(pk=self.user.pk).update(first_name='Ada')
+
+        response = self.client.post(CHANGE_URL, {
+            'old_password': 'old-Strong-passw0rd!',
+            'new_password': 'new-Strong-passw0rd!',
+            'new_password_confirm': 'new-Strong-passw0rd!',
+        }, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        user = CustomUser.objects.get(pk=self.user.pk)
+        self.assertTrue(user.check_password('new-Strong-passw0rd!'))
+        self.assertEqual(user.first_name, 'Ada')
+
+    def test_wrong_old_password_is_rejected(self):
+        response = self.client.post(CHANGE_URL, {
+            'old_password': 'nope',
+            'new_password': 'new-Strong-passw0rd!',
+            'new_password_confirm': 'new-Strong-passw0rd!',
+        }, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('old_password', response.data)
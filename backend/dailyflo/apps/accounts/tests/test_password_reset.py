@@ -0,0 +1,46 @@
+"""
+tests for POST /accounts/auth/password/reset/request/ — known and unknown emails get the same
+generic answer, so the endpoint can't be used to check which addresses have accounts.
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth.tokens import default_token_generator
+from django.test import TestCase
+from django.utils.encoding import force_str
+from django.utils.http import urlsafe_base64_decode
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+
+RESET_URL = '/accounts/auth/password/reset/request/'
+
+
+class PasswordResetRequestViewTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser(email='ada@example.com', auth_provider='email')
+        self.user.set_password('a-Strong-passw0rd!')
+        self.user.save()
+
+    def test_known_email_gets_a_valid_token(self):
+        response = self.client.post(RESET_URL, {'email': 'ada@example.com'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(default_token_generator.check_token(self.user, response.data['reset_token']))
+
+    def test_email_is_matched_case_insensitively(self):
+        response = self.client.post(RESET_URL, {'email': 'Ada@Example.com'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(force_str(urlsafe_base64_decode(response.data['uid'])), str(self.user.pk))
+        self.assertTrue(default_token_generator.check_token(self.user, response.data['reset_token']))
+
+    def test_unknown_email_gets_the_same_message(self):
+        known = self.client.post(RESET_URL, {'email': 'ada@example.com'}, format='json')
+
+        response = self.client.post(RESET_URL, {'email': 'nobody@example.com'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data), set(known.data))
+        self.assertEqual(response.data['message'], known.data['message'])
@@ -0,0 +1,53 @@
+"""
+tests for UserProfileSerializer / user_profile_payload — the hand-unrolled payload must keep producing
+exactly what drf's generic field loop would for the declared Meta.fields.
+"""
+
+from __future__ import annotations
+
+import json
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+from apps.accounts.serializers import UserProfileSerializer
+
+
+class UserProfileSerializerTests(TestCase):
+    def _assert_matches_generic(self, user):
+        serializer = UserProfileSerializer(user)
+        generic = serializers.ModelSerializer.to_representation(serializer, user)
+
+        self.assertEqual(serializer.data, generic)
+        self.assertEqual(tuple(serializer.data), UserProfileSerializer.Meta.fields)
+
+    def test_email_user_matches_generic_representation(self):
+        user = CustomUser(email='ada@example.com', first_name='Ada', auth_provider='email')
+        user.set_password('pw')
+        user.save()
+        user.last_login = timezone.now()
+
+        self._assert_matches_generic(user)
+
+    def test_social_user_without_login_matches_generic_representation(self):
+        user = CustomUser.objects.create(
+            email='g@example.com', auth_provider='google', auth_provider_id='g-1',
+            avatar_url='https://example.com/a.png',
+        )
+
+        self._assert_matches_generic(user)
+
+    def test_profile_endpoint_returns_profile_payload(self):
+        user = CustomUser(email='ada@example.com', first_name='Ada', auth_provider='email')
+        user.save()
+        client = APIClient()
+        client.force_authenticate(user)
+
+        response = client.get('/accounts/users/profile/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), json.loads(JSONRenderer().render(UserProfileSerializer(user).data)))
@@ -0,0 +1,55 @@
+"""
+tests for POST /accounts/auth/register/ — email uniqueness is enforced by the db constraint,
+so a duplicate signup must still come back as a friendly 400 (not a 500 from the IntegrityError).
+"""
+
+from __future__ import annotations
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+
+REGISTER_URL = '/accounts/auth/register/'
+
+
+class UserRegistrationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.payload = {
+            'email': 'new.user@example.com',
+            'password': 'a-Strong-passw0rd!',
+            'password_confirm': 'a-Strong-passw0rd!',
+        }
+
+    def test_register_creates_user_and_returns_tokens(self):
+        response = self.client.post(REGISTER_URL, self.payload, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertIn('access', response.data['tokens'])
+        user = CustomUser.objects.get(email=self.payload['email'])
+        self.assertEqual(response.data['user']['id'], str(user.id))
+        self.assertTrue(user.check_password(self.payload['password']))
+        # preferences come from the field default, nested dicts copied per user
+        self.assertEqual(user.preferences['theme'], 'light')
+        self.assertTrue(user.preferences['notifications']['enabled'])
+
+    def test_register_duplicate_email_returns_400_on_email_field(self):
+        self.client.post(REGISTER_URL, self.payload, format='json')
+
+        response = self.client.post(REGISTER_URL, self.payload, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('email', response.data)
+        self.assertEqual(CustomUser.objects.filter(email=self.payload['email']).count(), 1)
+
+    def test_register_case_variant_of_existing_email_returns_400(self):
+        self.client.post(REGISTER_URL, self.payload, format='json')
+
+        response = self.client.post(
+            REGISTER_URL, {**self.payload, 'email': 'New.User@Example.com'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('email', response.data)
+        self.assertEqual(CustomUser.objects.filter(email__iexact=self.payload['email']).count(), 1)
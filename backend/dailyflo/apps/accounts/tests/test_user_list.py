@@ -0,0 +1,78 @@
+"""
+tests for the admin user list/detail endpoints — full_name and is_social_user come from
+sql annotations (CustomUser.objects.with_profile_annotations) rather than per-row python.
+"""
+
+from __future__ import annotations
+
+import json
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+from apps.accounts.serializers import UserListSerializer
+
+LIST_URL = '/accounts/users/list/'
+
+
+class UserListViewTests(TestCase):
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(
+            username='admin@example.com', email='admin@example.com', password='pw', is_staff=True,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_list_rows_render_like_user_list_serializer(self):
+        # list() builds rows from values() — once rendered they must match the serializer's output
+        listed = {row['email']: row for row in self.client.get(LIST_URL).json()}['admin@example.com']
+        serialized = UserListSerializer(CustomUser.list_queryset().get(pk=self.admin.pk)).data
+
+        self.assertEqual(listed, json.loads(JSONRenderer().render(serialized)))
+
+    def test_all_param_streams_same_rows(self):
+        CustomUser.objects.create_user(username='b@example.com', email='b@example.com', first_name='B')
+        regular = self.client.get(LIST_URL).json()
+
+        response = self.client.get(LIST_URL, {'all': '1'})
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), regular)
+
+    def _by_email(self, response):
+        return {row['email']: row for row in response.data}
+
+    def test_full_name_matches_model_for_partial_names(self):
+        CustomUser.objects.create_user(
+            username='both@example.com', email='both@example.com', first_name='Ada', last_name='Lovelace',
+        )
+        CustomUser.objects.create_user(username='first@example.com', email='first@example.com', first_name='Ada')
+        CustomUser.objects.create_user(username='last@example.com', email='last@example.com', last_name='Lovelace')
+
+        # one narrow SELECT — no deferred-column loads while serializing
+        with self.assertNumQueries(1):
+            rows = self._by_email(self.client.get(LIST_URL))
+
+        self.assertEqual(rows['both@example.com']['full_name'], 'Ada Lovelace')
+        self.assertEqual(rows['first@example.com']['full_name'], 'Ada')
+        self.assertEqual(rows['last@example.com']['full_name'], 'Lovelace')
+        self.assertEqual(rows['admin@example.com']['full_name'], '')
+
+    def test_filters_and_social_flag(self):
+        CustomUser.objects.create(
+            email='g@example.com', auth_provider='google', auth_provider_id='g-1', is_email_verified=True,
+        )
+
+        rows = self._by_email(self.client.get(LIST_URL, {'auth_provider': 'google', 'is_verified': 'true'}))
+
+        self.assertEqual(list(rows), ['g@example.com'])
+        self.assertTrue(rows['g@example.com']['is_social_user'])
+
+    def test_soft_deleted_users_are_hidden(self):
+        CustomUser.objects.create_user(username='gone@example.com', email='gone@example.com', soft_deleted=True)
+
+        rows = self._by_email(self.client.get(LIST_URL))
+
+        self.assertNotIn('gone@example.com', rows)
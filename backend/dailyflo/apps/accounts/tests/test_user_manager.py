@@ -0,0 +1,40 @@
+"""
+tests for the CustomUser managers — objects hides soft deleted accounts, all_objects doesn't,
+and the bulk helpers write whole batches without going through save().
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth.hashers import make_password
+from django.test import TestCase
+
+from apps.accounts.models import CustomUser
+
+
+class CustomUserManagerTests(TestCase):
+    def test_bulk_register_creates_users_and_skips_existing_emails(self):
+        CustomUser.objects.create_user(username='taken@example.com', email='taken@example.com')
+
+        CustomUser.objects.bulk_register(
+            [('a@example.com', 'Ada', ''), ('taken@example.com', 'Dup', ''), ('b@example.com', '', 'Byron')],
+            make_password('pw'),
+        )
+
+        self.assertEqual(CustomUser.objects.count(), 3)
+        user = CustomUser.objects.get(email='a@example.com')
+        self.assertIsNone(user.username)
+        self.assertTrue(user.check_password('pw'))
+        self.assertEqual(user.preferences['theme'], 'light')
+        self.assertEqual(CustomUser.objects.get(email='taken@example.com').first_name, '')
+
+    def test_bulk_soft_delete_hides_users_from_default_manager(self):
+        keep = CustomUser.objects.create_user(username='keep@example.com', email='keep@example.com')
+        gone = CustomUser.objects.create_user(username='gone@example.com', email='gone@example.com')
+
+        updated = CustomUser.objects.bulk_soft_delete([gone.pk])
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(list(CustomUser.objects.values_list('pk', flat=True)), [keep.pk])
+        gone = CustomUser.all_objects.get(pk=gone.pk)
+        self.assertTrue(gone.soft_deleted)
+        self.assertFalse(gone.is_active)
@@ -9,19 +9,32 @@ from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 from django.core.mail import send_mail
 from django.conf import settings
-from django.shortcuts import get_object_or_404
+from django.http import Http404
+from django.db.models import F
+from django.db.models.functions import Lower
+from apps.common.streaming import streaming_json_response
 from .models import CustomUser
 from .social_auth import verify_apple_id_token, verify_google_id_token
 from .serializers import (
     UserRegistrationSerializer, SocialAuthSerializer, UserLoginSerializer,
     PasswordChangeSerializer, PasswordResetRequestSerializer, 
-    PasswordResetConfirmSerializer, UserProfileSerializer, 
-    UserUpdateSerializer, UserListSerializer
+    PasswordResetConfirmSerializer,
+    UserUpdateSerializer, UserListSerializer, user_profile_payload
 )
 
 
+# UserListSerializer fields that values() can read directly (is_social_user is renamed from is_social_user_db)
+_USER_LIST_COLUMNS = tuple(f for f in UserListSerializer.Meta.fields if f != 'is_social_user')
+
+
+# columns PasswordTokenGenerator reads when hashing a reset token
+_RESET_TOKEN_FIELDS = ('pk', 'password', 'last_login', 'email')
+
+
 def get_tokens_for_user(user):
     """generate JWT tokens for user"""
+    # signing key is prepared once by simplejwt's shared TokenBackend (state.token_backend), so each
+    # call here is just claim building + two HMAC signs + the blacklist app's OutstandingToken INSERT
     refresh = RefreshToken.for_user(user)  # create refresh token for user
     return {  # return both tokens as strings
         'refresh': str(refresh),  # long-lived token for getting new access tokens
@@ -45,7 +58,7 @@ class UserRegistrationView(APIView):
             return Response({  # return success response with user data and tokens
                 'message': 'User registered successfully',
                 'tokens': tokens,  # JWT tokens for immediate login
-                'user': UserProfileSerializer(user).data  # user profile data
+                'user': user_profile_payload(user)  # user profile data
             }, status=status.HTTP_201_CREATED)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)  # return validation errors
@@ -87,8 +100,14 @@ class SocialAuthView(APIView):
             email_verified_bool = bool(ev_raw)
 
         # conflict only when provider shared a real email (compare apples-to-apples with existing rows)
+        # all_objects: email stays unique across soft deleted rows too; lower(email) like users_email_lower_uniq
         if raw_email:
-            conflict = CustomUser.objects.filter(email=email).exclude(auth_provider=provider).first()
+            conflict = (
+                CustomUser.all_objects.alias(email_lower=Lower('email'))
+                .filter(email_lower=email.lower())
+                .exclude(auth_provider=provider)
+                .first()
+            )
             if conflict:
                 return Response(
                     {
@@ -101,7 +120,7 @@ class SocialAuthView(APIView):
                     status=status.HTTP_409_CONFLICT,
                 )
 
-        user, created = CustomUser.objects.get_or_create(
+        user, created = CustomUser.all_objects.get_or_create(
             auth_provider=provider,
             auth_provider_id=provider_user_id,
             defaults={
@@ -112,13 +131,15 @@ class SocialAuthView(APIView):
                 'is_email_verified': email_verified_bool,
             },
         )
+        if user.soft_deleted:
+            return Response({'error': 'User account has been deleted'}, status=status.HTTP_403_FORBIDDEN)
 
         tokens = get_tokens_for_user(user)
         return Response(
             {
                 'message': f'Authenticated with {provider}',
                 'tokens': tokens,
-                'user': UserProfileSerializer(user).data,
+                'user': user_profile_payload(user),
                 'is_new_user': created,
             },
             status=status.HTTP_200_OK,
@@ -143,7 +164,7 @@ class UserLoginView(APIView):
             return Response({  # return success response
                 'message': 'Login successful',
                 'tokens': tokens,  # JWT tokens for API access
-                'user': UserProfileSerializer(user).data  # user profile data
+                'user': user_profile_payload(user)  # user profile data
             }, status=status.HTTP_200_OK)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)  # return validation errors
@@ -160,7 +181,7 @@ class PasswordChangeView(APIView):
         if serializer.is_valid():  # check if data is valid
             user = request.user  # get current authenticated user
             user.set_password(serializer.validated_data['new_password'])  # set new password (hashed)
-            user.save()  # save user with new password
+            user.save(update_fields=['password', 'updated_at'])  # write just the new hash
             
             return Response({  # return success response
                 'message': 'Password changed successfully'
@@ -180,7 +201,16 @@ class PasswordResetRequestView(APIView):
         serializer = PasswordResetRequestSerializer(data=request.data)  # validate email
         if serializer.is_valid():  # check if email is valid
             email = serializer.validated_data['email']  # get email from request
-            user = CustomUser.objects.get(email=email, auth_provider='email')  # find user by email
+            # one narrow lookup: make_token() hashes pk, password, last_login and email.
+            # lower(email) like EmailBackend, so any casing that can log in can also reset
+            user = CustomUser.objects.alias(email_lower=Lower('email')).filter(
+                email_lower=email.lower(), auth_provider='email'
+            ).only(*_RESET_TOKEN_FIELDS).first()
+            
+            if user is None:
+                # same hashing work and same response shape as a real account, so unknown emails can't
+                # be told apart — the unsaved user's random pk matches no account
+                user = CustomUser(email=email)
             
             # generate reset token
             token = default_token_generator.make_token(user)  # create secure reset token
@@ -222,8 +252,8 @@ class UserProfileView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def get(self, request):
-        serializer = UserProfileSerializer(request.user)  # serialize current user data
-        return Response(serializer.data, status=status.HTTP_200_OK)  # return user profile data
+        # request.user is already loaded by jwt auth — build the fixed-shape payload directly
+        return Response(user_profile_payload(request.user), status=status.HTTP_200_OK)  # return user profile data
 
 
 class UserProfileUpdateView(UpdateAPIView):
@@ -249,7 +279,7 @@ class UserProfileUpdateView(UpdateAPIView):
         
         return Response({  # return custom success response
             'message': 'Profile updated successfully',
-            'user': UserProfileSerializer(instance).data  # include updated user data
+            'user': user_profile_payload(serializer.instance)  # include updated user data
         }, status=status.HTTP_200_OK)
 
 
@@ -259,21 +289,38 @@ class UserListView(ListAPIView):
     """
     permission_classes = [permissions.IsAdminUser]
     serializer_class = UserListSerializer
-    queryset = CustomUser.objects.filter(soft_deleted=False)
     
     def get_queryset(self):
-        queryset = super().get_queryset()  # get base queryset (non-deleted users)
+        queryset = CustomUser.list_queryset()  # narrow, annotated queryset of non-deleted users
         
-        # add filtering options
-        auth_provider = self.request.query_params.get('auth_provider')  # get auth provider filter
+        # add filtering options — collected in one pass, applied with a single filter() clone
+        params = self.request.query_params
+        filters = {}
+        auth_provider = params.get('auth_provider')  # get auth provider filter
         if auth_provider:  # if provider filter provided
-            queryset = queryset.filter(auth_provider=auth_provider)  # filter by provider
+            filters['auth_provider'] = auth_provider  # filter by provider
         
-        is_verified = self.request.query_params.get('is_verified')  # get verification filter
+        is_verified = params.get('is_verified')  # get verification filter
         if is_verified is not None:  # if verification filter provided
-            queryset = queryset.filter(is_email_verified=is_verified.lower() == 'true')  # filter by verification status
+            filters['is_email_verified'] = is_verified.lower() == 'true'  # filter by verification status
+        
+        if filters:
+            queryset = queryset.filter(**filters)
         
         return queryset  # return filtered queryset
+    
+    def list(self, request, *args, **kwargs):
+        """
+        fixed-shape admin list: rows come straight from values() as dicts, skipping per-row
+        serializer field access. same keys as UserListSerializer (uuid/datetimes encoded by the renderer)
+        """
+        rows = self.get_queryset().values(
+            *_USER_LIST_COLUMNS, is_social_user=F('is_social_user_db'),
+        )
+        if request.query_params.get('all') == '1':
+            # export: stream rows from a chunked (server-side on postgres) cursor, memory ~ chunk size
+            return streaming_json_response(rows.iterator(chunk_size=500))
+        return Response(list(rows))
 
 
 class UserDetailView(RetrieveAPIView):
@@ -285,7 +332,7 @@ class UserDetailView(RetrieveAPIView):
     lookup_field = 'id'
     
     def get_queryset(self):
-        return CustomUser.objects.filter(soft_deleted=False)  # return only non-deleted users
+        return CustomUser.list_queryset()  # only non-deleted users, listed columns only
 
 
 class UserDeactivateView(APIView):
@@ -295,18 +342,17 @@ class UserDeactivateView(APIView):
     permission_classes = [permissions.IsAdminUser]
     
     def post(self, request, user_id):
-        user = get_object_or_404(CustomUser, id=user_id, soft_deleted=False)  # find user by ID (not deleted)
-        
-        # prevent admin from deactivating themselves
-        if user == request.user:  # check if admin is trying to deactivate themselves
+        # prevent admin from deactivating themselves (uuid compare, no db hit)
+        if user_id == request.user.id:
             return Response({  # return error response
                 'error': 'Cannot deactivate your own account'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        user.soft_deleted = True  # mark user as soft deleted
-        user.is_active = False  # deactivate user account
-        user.save()  # save changes to database
+        # one 3-column UPDATE instead of SELECT * + full save(); the default manager skips deleted users
+        if not CustomUser.objects.bulk_soft_delete([user_id]):
+            raise Http404
+        email = CustomUser.all_objects.filter(id=user_id).values_list('email', flat=True).first()
         
         return Response({  # return success response
-            'message': f'User {user.email} has been deactivated'
+            'message': f'User {email} has been deactivated'
         }, status=status.HTTP_200_OK)
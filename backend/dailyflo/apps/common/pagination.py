@@ -0,0 +1,35 @@
+from django.core.paginator import Paginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class PkCountPaginator(Paginator):
+    """
+    paginator whose COUNT(*) runs over bare primary keys — list querysets carry select_related
+    joins, ordering and annotations (with_overdue, task counts) that the count doesn't need
+    """
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, QuerySet):
+            return self.object_list.order_by().values('pk').count()
+        return super().count
+
+
+class OptionalPageNumberPagination(PageNumberPagination):
+    """
+    page-number pagination that only kicks in when the client asks for it (?page= or ?page_size=).
+    without either param the endpoint keeps returning the plain array the app already expects.
+    """
+
+    django_paginator_class = PkCountPaginator
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.page_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
@@ -0,0 +1,26 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# 'Z' for utc datetimes (same as drf's encoder); dict keys that aren't strings are stringified
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# types orjson doesn't know natively (lazy strings, decimals, querysets, ...) go through drf's encoder
+_fallback_encoder = JSONEncoder()
+
+
+def dumps(data, indent=False):
+    """encode to json bytes — same output as drf's JSONRenderer, produced by orjson"""
+    option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+    return orjson.dumps(data, default=_fallback_encoder.default, option=option)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """drop-in for rest_framework.renderers.JSONRenderer backed by orjson"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # drf's indent lookup (Accept '; indent=' param, else the browsable api's renderer_context).
+        # orjson only pretty-prints with two spaces, so any indent gives OPT_INDENT_2
+        return dumps(data, indent=bool(self.get_indent(accepted_media_type, renderer_context or {})))
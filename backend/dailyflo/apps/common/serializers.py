@@ -0,0 +1,28 @@
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    build a ModelSerializer's field set once per class instead of on every instantiation.
+
+    ModelSerializer.get_fields() walks the model meta and runs build_field() for every field each time
+    a serializer is created; the result only depends on the class, so it is built once and each
+    instance gets shallow copies of the cached (never bound) fields — bind() then sets parent /
+    field_name / source on the copy only. a deep copy would re-run every field's __init__.
+    only for flat serializers whose fields don't depend on context / instance (no nested serializers,
+    whose child fields would be shared between copies).
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = CachedFieldsMixin._fields_cache[cls] = super().get_fields()
+        return {name: copy.copy(field) for name, field in fields.items()}
+
+    @classmethod
+    def warm_fields_cache(cls):
+        """build the cached field set now (called from AppConfig.ready) so no request pays for it"""
+        cls().get_fields()
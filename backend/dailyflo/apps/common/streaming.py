@@ -0,0 +1,19 @@
+from django.http import StreamingHttpResponse
+
+from .renderers import dumps
+
+
+def stream_json_array(rows):
+    """yield a json array one row at a time (same encoding as the api's ORJSONRenderer)"""
+    yield b'['
+    for index, row in enumerate(rows):
+        yield (b',' if index else b'') + dumps(row)
+    yield b']'
+
+
+def streaming_json_response(rows):
+    """
+    json array response that encodes rows as they are consumed — pass a queryset .iterator()
+    so memory stays ~ one chunk however many rows there are
+    """
+    return StreamingHttpResponse(stream_json_array(rows), content_type='application/json')
@@ -46,10 +46,7 @@ class UserGoalSerializer(serializers.ModelSerializer):
         super().__init__(*args, **kwargs)
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            self.fields['linkedTaskId'].queryset = Task.objects.filter(
-                user=request.user,
-                soft_deleted=False,
-            )
+            self.fields['linkedTaskId'].queryset = Task.objects.for_user(request.user)
 
     def validate(self, attrs):
         goal_type = attrs.get('goal_type', getattr(self.instance, 'goal_type', 'task_count'))
@@ -4,6 +4,8 @@ goal period windows and progress from completed activity logs.
 
 from datetime import date, timedelta
 
+from django.utils import timezone as django_tz
+
 from apps.gamification.models import UserGoal
 from apps.gamification.services.stats import effective_completion_date, get_user_timezone, _week_start
 from apps.tasks.models import ActivityLog
@@ -85,8 +87,6 @@ def compute_goals_progress_summary(user, user_tz, today: date):
 
 
 def list_user_goals(user):
-    from django.utils import timezone as django_tz
-
     user_tz = get_user_timezone(user)
     today = django_tz.now().astimezone(user_tz).date()
     goals = UserGoal.objects.filter(user=user, is_active=True)
@@ -28,17 +28,23 @@ class ListAdmin(admin.ModelAdmin):
         })
     )
     
+    # owner column comes from the same SELECT, counts from one grouped aggregate (no per-row queries)
+    list_select_related = ('user',)
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_task_counts()
+    
+    @admin.display(description='Total Tasks', ordering='task_count')
     def task_count(self, obj):
-        return obj.get_task_count()
-    task_count.short_description = 'Total Tasks'
+        return obj.task_count
     
+    @admin.display(description='Completed', ordering='completed_task_count')
     def completed_task_count(self, obj):
-        return obj.get_completed_task_count()
-    completed_task_count.short_description = 'Completed'
+        return obj.completed_task_count
     
+    @admin.display(description='Pending', ordering='pending_task_count')
     def pending_task_count(self, obj):
-        return obj.get_pending_task_count()
-    pending_task_count.short_description = 'Pending'
+        return obj.pending_task_count
 
 
 admin.site.register(List, ListAdmin)
\ No newline at end of file
@@ -1,23 +1,45 @@
+from functools import cached_property
+
 from django.db import models
 from django.conf import settings
 import uuid
 
 
+# color choices matching wireframe designs (module level so List.Meta's check constraint can read them)
+COLOR_CHOICES = [
+    ('red', 'Red'),
+    ('blue', 'Blue'),
+    ('green', 'Green'),
+    ('yellow', 'Yellow'),
+    ('purple', 'Purple'),
+    ('teal', 'Teal'),
+    ('orange', 'Orange'),
+]
+
+
+class ListQuerySet(models.QuerySet):
+    """queryset helpers for list endpoints"""
+
+    def with_task_counts(self):
+        """
+        total / completed / pending live-task counts as one grouped query
+        instead of three COUNT queries per list (get_task_count etc. stay for single objects)
+        """
+        live = models.Q(tasks__soft_deleted=False)
+        return self.annotate(
+            task_count=models.Count('tasks', filter=live),
+            completed_task_count=models.Count('tasks', filter=live & models.Q(tasks__is_completed=True)),
+            # is_completed is non-null, so pending is the difference — no third filtered count
+            pending_task_count=models.F('task_count') - models.F('completed_task_count'),
+        )
+
+
 class List(models.Model):
     """
     Task list model for organizing tasks into categories
     """
     
-    # color choices matching wireframe designs
-    COLOR_CHOICES = [
-        ('red', 'Red'),
-        ('blue', 'Blue'),
-        ('green', 'Green'),
-        ('yellow', 'Yellow'),
-        ('purple', 'Purple'),
-        ('teal', 'Teal'),
-        ('orange', 'Orange'),
-    ]
+    COLOR_CHOICES = COLOR_CHOICES
     
     # primary key
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -76,12 +98,12 @@ class List(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ListQuerySet.as_manager()
+    
     class Meta:
         db_table = 'lists'
         verbose_name = 'List'
         verbose_name_plural = 'Lists'
-        # ensure unique list names per user
-        unique_together = ['user', 'name']
         # database indexes for performance
         indexes = [
             models.Index(fields=['user']),
@@ -89,33 +111,81 @@ class List(models.Model):
             models.Index(fields=['is_default']),
             models.Index(fields=['soft_deleted']),
         ]
+        constraints = [
+            # unique list names per user among live lists — a soft deleted list frees its name
+            models.UniqueConstraint(
+                fields=['user', 'name'],
+                condition=models.Q(soft_deleted=False),
+                name='uniq_active_list_name_per_user',
+            ),
+            # at most one live default (inbox) list per user; its partial unique index is also
+            # what the inbox lookup (user, is_default=True, soft_deleted=False) reads
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=models.Q(is_default=True, soft_deleted=False),
+                name='one_default_per_user',
+            ),
+            # color must be one of COLOR_CHOICES even for writes that skip serializers (update(), bulk_create)
+            models.CheckConstraint(
+                condition=models.Q(color__in=[value for value, _ in COLOR_CHOICES]),
+                name='list_color_valid',
+            ),
+        ]
         # ordering
         ordering = ['sort_order', 'name']
     
     def __str__(self):
         return f"{self.name} ({self.user.email})"
     
+    @cached_property
+    def task_counts(self):
+        """total / completed / pending live-task counts from one aggregate query, cached per instance"""
+        return self.tasks.filter(soft_deleted=False).aggregate(
+            total=models.Count('id'),
+            completed=models.Count('id', filter=models.Q(is_completed=True)),
+            pending=models.Count('id', filter=models.Q(is_completed=False)),
+        )
+    
+    def get_task_counts(self):
+        """get total / completed / pending task counts as a dict"""
+        return self.task_counts
+    
     def get_task_count(self):
         """get total number of tasks in this list"""
-        return self.tasks.filter(soft_deleted=False).count()
+        return self.task_counts['total']
     
     def get_completed_task_count(self):
         """get number of completed tasks in this list"""
-        return self.tasks.filter(soft_deleted=False, is_completed=True).count()
+        return self.task_counts['completed']
     
     def get_pending_task_count(self):
         """get number of pending tasks in this list"""
-        return self.tasks.filter(soft_deleted=False, is_completed=False).count()
+        return self.task_counts['pending']
+    
+    # is_default as last read from / written to the db — new instances start as not default
+    _loaded_is_default = False
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # deferred is_default (only()/defer()) stays unknown, so save() falls back to demoting
+        instance._loaded_is_default = instance.__dict__.get('is_default', False)
+        return instance
     
     def save(self, *args, **kwargs):
         """override save to handle default list creation"""
-        # ensure only one default list per user
-        if self.is_default:
+        # ensure only one default list per user (one_default_per_user rejects a second one) — only
+        # needed when this list is becoming the default and the write actually includes is_default
+        update_fields = kwargs.get('update_fields')
+        writes_default = update_fields is None or 'is_default' in update_fields
+        if self.is_default and writes_default and not self._loaded_is_default:
             # remove default flag from other lists for this user
             List.objects.filter(
-                user=self.user,
+                user_id=self.user_id,
                 is_default=True,
                 soft_deleted=False
             ).exclude(id=self.id).update(is_default=False)
         
         super().save(*args, **kwargs)
+        if writes_default:
+            self._loaded_is_default = self.is_default
@@ -2,37 +2,63 @@ from django.db.models import Max
 from rest_framework import serializers
 from .models import List
 
+# stateless formatter for ListSerializer.to_representation (honours REST_FRAMEWORK DATETIME_FORMAT)
+_DATETIME_FIELD = serializers.DateTimeField()
+
 
 class ListSerializer(serializers.ModelSerializer):
     """
     Serializer for task lists
+    reads counts annotated by List.objects.with_task_counts(), else aggregates them per list
     """
-    task_count = serializers.SerializerMethodField()
-    completed_task_count = serializers.SerializerMethodField()
-    pending_task_count = serializers.SerializerMethodField()
+    task_count = serializers.IntegerField(read_only=True)
+    completed_task_count = serializers.IntegerField(read_only=True)
+    pending_task_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = List
-        fields = [
+        fields = (
             'id', 'user', 'name', 'description', 'color', 'icon',
             'is_default', 'sort_order', 'metadata', 'soft_deleted',
             'task_count', 'completed_task_count', 'pending_task_count',
             'created_at', 'updated_at',
-        ]
+        )
         read_only_fields = [
             'id', 'user', 'created_at', 'updated_at', 'soft_deleted', 'is_default',
             'metadata',
             'task_count', 'completed_task_count', 'pending_task_count',
         ]
     
-    def get_task_count(self, obj):
-        return obj.get_task_count()
-    
-    def get_completed_task_count(self, obj):
-        return obj.get_completed_task_count()
-    
-    def get_pending_task_count(self, obj):
-        return obj.get_pending_task_count()
+    def to_representation(self, instance):
+        """
+        read path built straight from attributes instead of drf's generic per-field loop
+        (every /lists/ response goes through here). keep in step with Meta.fields.
+        """
+        # lists loaded without with_task_counts() fall back to one aggregate query for all three
+        if hasattr(instance, 'task_count'):
+            total, completed, pending = (
+                instance.task_count, instance.completed_task_count, instance.pending_task_count,
+            )
+        else:
+            counts = instance.get_task_counts()
+            total, completed, pending = counts['total'], counts['completed'], counts['pending']
+        return {
+            'id': str(instance.id),
+            'user': instance.user_id,
+            'name': instance.name,
+            'description': instance.description,
+            'color': instance.color,
+            'icon': instance.icon,
+            'is_default': instance.is_default,
+            'sort_order': instance.sort_order,
+            'metadata': instance.metadata,
+            'soft_deleted': instance.soft_deleted,
+            'task_count': total,
+            'completed_task_count': completed,
+            'pending_task_count': pending,
+            'created_at': _DATETIME_FIELD.to_representation(instance.created_at),
+            'updated_at': _DATETIME_FIELD.to_representation(instance.updated_at),
+        }
     
     def create(self, validated_data):
         """create new list with current user"""
@@ -68,21 +94,7 @@ class ListUpdateSerializer(serializers.ModelSerializer):
         model = List
         fields = ['name', 'description', 'color', 'icon', 'sort_order', 'metadata']
         # Note: No 'is_default' field - users shouldn't be able to change this
-    
-    def validate_name(self, value):
-        """validate unique list name per user"""
-        user = self.context['request'].user
-        instance = self.instance  # Current list being updated
-        
-        # Check if another list with this name exists (excluding current list)
-        if List.objects.filter(
-            user=user, 
-            name=value, 
-            soft_deleted=False
-        ).exclude(id=instance.id).exists():
-            raise serializers.ValidationError("A list with this name already exists.")
-        
-        return value
+        # name uniqueness is enforced by uniq_active_list_name_per_user (ListViewSet maps the IntegrityError)
 
 class ListDeleteSerializer(serializers.Serializer):
     """
@@ -1,3 +1,180 @@
+"""
+tests for lists — task counts come from one annotated query (List.objects.with_task_counts)
+instead of three COUNTs per list, List.save() keeps a single default list per user, and live list
+names are unique per user (enforced by the db constraint).
+"""
+
+from __future__ import annotations
+
+from django.db import IntegrityError, transaction
 from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+from apps.tasks.models import Task
+
+from .models import List
+from .serializers import ListSerializer
+
+LIST_URL = '/lists/'
+
+
+class ListViewSetTaskCountTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_counts_live_tasks_in_one_query(self):
+        work = List.objects.create(user=self.user, name='Work')
+        List.objects.create(user=self.user, name='Empty')
+        Task.objects.create(user=self.user, list=work, title='a')
+        Task.objects.create(user=self.user, list=work, title='b', is_completed=True)
+        Task.objects.create(user=self.user, list=work, title='gone', soft_deleted=True)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(LIST_URL)
+
+        rows = {row['name']: row for row in response.data}
+        self.assertEqual(
+            (rows['Work']['task_count'], rows['Work']['completed_task_count'], rows['Work']['pending_task_count']),
+            (2, 1, 1),
+        )
+        self.assertEqual(rows['Empty']['task_count'], 0)
+
+    def test_serializer_falls_back_to_single_aggregate(self):
+        work = List.objects.create(user=self.user, name='Work')
+        Task.objects.create(user=self.user, list=work, title='a', is_completed=True)
+        work = List.objects.get(pk=work.pk)
+
+        with self.assertNumQueries(1):
+            data = ListSerializer(work).data
+
+        self.assertEqual((data['task_count'], data['completed_task_count'], data['pending_task_count']), (1, 1, 0))
+
+    def test_serializer_matches_generic_representation(self):
+        work = List.objects.with_task_counts().get(pk=List.objects.create(user=self.user, name='Work').pk)
+        serializer = ListSerializer(work)
+
+        self.assertEqual(serializer.data, serializers.ModelSerializer.to_representation(serializer, work))
+
+    def test_inbox_includes_counts(self):
+        inbox = List.objects.create(user=self.user, name='Inbox', is_default=True)
+        Task.objects.create(user=self.user, list=inbox, title='a')
+
+        response = self.client.get(f'{LIST_URL}inbox/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['task_count'], 1)
+
+
+class ListDefaultFlagTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+
+    def test_new_default_demotes_previous_default(self):
+        first = List.objects.create(user=self.user, name='Inbox', is_default=True)
+
+        List.objects.create(user=self.user, name='Other', is_default=True)
+
+        first.refresh_from_db()
+        self.assertFalse(first.is_default)
+
+    def test_db_rejects_second_live_default(self):
+        List.objects.create(user=self.user, name='Inbox', is_default=True)
+        other = List.objects.create(user=self.user, name='Other')
+
+        # bypasses save(), so only the one_default_per_user constraint stands in the way
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            List.objects.filter(pk=other.pk).update(is_default=True)
+
+    def test_db_rejects_unknown_color(self):
+        work = List.objects.create(user=self.user, name='Work')
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            List.objects.filter(pk=work.pk).update(color='magenta')
+
+    def test_resaving_existing_default_skips_demotion_update(self):
+        inbox = List.objects.create(user=self.user, name='Inbox', is_default=True)
+        inbox = List.objects.get(pk=inbox.pk)
+        inbox.name = 'Renamed'
+
+        # just the row's own UPDATE
+        with self.assertNumQueries(1):
+            inbox.save()
+
+
+class ListNameUniquenessTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_duplicate_name_on_create_is_400(self):
+        List.objects.create(user=self.user, name='Work')
+
+        response = self.client.post(LIST_URL, {'name': 'Work'}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('name', response.data)
+
+    def test_rename_onto_existing_name_is_400(self):
+        List.objects.create(user=self.user, name='Work')
+        home = List.objects.create(user=self.user, name='Home')
+
+        response = self.client.patch(f'{LIST_URL}{home.pk}/', {'name': 'Work'}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('name', response.data)
+
+    def test_soft_deleted_list_frees_its_name(self):
+        List.objects.create(user=self.user, name='Work', soft_deleted=True)
+
+        response = self.client.post(LIST_URL, {'name': 'Work'}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+
+
+class ListTasksActionTests(TestCase):
+    def test_tasks_action_lists_only_own_live_tasks(self):
+        user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        other = CustomUser.objects.create_user(username='o@example.com', email='o@example.com')
+        work = List.objects.create(user=user, name='Work')
+        Task.objects.create(user=user, list=work, title='a')
+        Task.objects.create(user=user, list=work, title='gone', soft_deleted=True)
+        client = APIClient()
+
+        client.force_authenticate(user)
+        response = client.get(f'{LIST_URL}{work.pk}/tasks/')
+        client.force_authenticate(other)
+        foreign = client.get(f'{LIST_URL}{work.pk}/tasks/')
+
+        self.assertEqual([row['title'] for row in response.data], ['a'])
+        self.assertEqual(foreign.status_code, 404)
+
+    def test_tasks_action_is_one_query_for_any_number_of_tasks(self):
+        user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        work = List.objects.create(user=user, name='Work', color='red')
+        for i in range(5):
+            Task.objects.create(user=user, list=work, title=f't{i}')
+        client = APIClient()
+        client.force_authenticate(user)
+
+        # ownership checked through the list join — one task query, narrow columns
+        with self.assertNumQueries(1) as ctx:
+            response = client.get(f'{LIST_URL}{work.pk}/tasks/')
+
+        self.assertEqual({row['list_name'] for row in response.data}, {'Work'})
+        self.assertNotIn('"sort_order"', ctx.captured_queries[0]['sql'].split(' FROM ')[0])
+
+    def test_tasks_action_empty_list_vs_missing_list(self):
+        user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        empty = List.objects.create(user=user, name='Empty')
+        gone = List.objects.create(user=user, name='Gone', soft_deleted=True)
+        client = APIClient()
+        client.force_authenticate(user)
 
-# Create your tests here.
+        self.assertEqual(client.get(f'{LIST_URL}{empty.pk}/tasks/').data, [])
+        self.assertEqual(client.get(f'{LIST_URL}{gone.pk}/tasks/').status_code, 404)
+        self.assertEqual(client.get(f'{LIST_URL}not-a-uuid/tasks/').status_code, 404)
@@ -1,9 +1,10 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from . import views
 
 # create router for ViewSets
-router = DefaultRouter()
+# SimpleRouter — the list endpoint owns /lists/, so DefaultRouter's api-root would be dead
+router = SimpleRouter()
 router.register(r'', views.ListViewSet, basename='list')
 
 urlpatterns = [
@@ -1,6 +1,11 @@
+import uuid
+
 from rest_framework import viewsets, status, permissions, filters
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from django.db import IntegrityError, transaction
+from django.http import Http404
 from django_filters.rest_framework import DjangoFilterBackend
 from apps.tasks.models import Task
 from apps.tasks.serializers import TaskListSerializer
@@ -17,12 +22,21 @@ class ListViewSet(viewsets.ModelViewSet):
     ordering_fields = ['sort_order', 'name', 'created_at']
     ordering = ['sort_order', 'name']
     
+    # actions that respond with ListSerializer — only these pay for the task-count aggregate
+    _COUNTED_ACTIONS = frozenset({'list', 'retrieve', 'inbox'})
+    
     def get_queryset(self):
         """filter lists by current user"""
-        return List.objects.filter(
+        qs = List.objects.filter(
             user=self.request.user,
             soft_deleted=False
         )
+        if self.action in self._COUNTED_ACTIONS:
+            qs = qs.with_task_counts()
+        elif self.action == 'tasks':
+            # only the ownership check + the id for the task filter — skip description / metadata json
+            qs = qs.only('id')
+        return qs
     
     def get_serializer_class(self):
         """return appropriate serializer based on action"""
@@ -35,7 +49,26 @@ class ListViewSet(viewsets.ModelViewSet):
     
     def perform_create(self, serializer):
         """create list (user set in ListCreateSerializer.create)"""
-        serializer.save()
+        self._save_with_unique_name(serializer)
+    
+    def perform_update(self, serializer):
+        self._save_with_unique_name(serializer)
+    
+    def _save_with_unique_name(self, serializer):
+        """
+        save, letting the db constraint catch duplicate live list names — no pre-check SELECT;
+        the lookup below only runs on the failure path to tell a name clash from other errors
+        """
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError:
+            name = serializer.validated_data.get('name')
+            if name is not None and List.objects.filter(
+                user=self.request.user, name=name, soft_deleted=False
+            ).exclude(pk=getattr(serializer.instance, 'pk', None)).exists():
+                raise ValidationError({'name': ['A list with this name already exists.']})
+            raise
 
     def perform_destroy(self, instance):
         """soft delete list; point tasks at inbox (null list) so they still show in Inbox"""
@@ -45,28 +78,33 @@ class ListViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get'])
     def tasks(self, request, pk=None):
-        """tasks belonging to this list (same contract as former /tasks/lists/<id>/tasks/)"""
-        list_obj = self.get_object()
-        qs = Task.objects.filter(
-            list=list_obj,
-            user=request.user,
-            soft_deleted=False,
-        ).select_related('list')
+        """
+        tasks belonging to this list (same contract as former /tasks/lists/<id>/tasks/).
+        the list ownership check rides on the task query's list join (one query); the separate
+        list lookup only runs when no rows come back, to tell an empty list from a 404
+        """
+        try:
+            list_id = uuid.UUID(str(pk))
+        except ValueError:
+            raise Http404
+        qs = Task.objects.for_user(request.user).filter(
+            list_id=list_id,
+            list__user=request.user,
+            list__soft_deleted=False,
+        ).for_list_rows()
         is_completed = request.query_params.get('completed')
         if is_completed is not None:
             qs = qs.filter(is_completed=is_completed.lower() == 'true')
-        serializer = TaskListSerializer(qs, many=True)
-        return Response(serializer.data)
+        data = TaskListSerializer(qs, many=True).data
+        if not data and not self.get_queryset().filter(pk=list_id).exists():
+            raise Http404
+        return Response(data)
 
     @action(detail=False, methods=['get'])
     def inbox(self, request):
         """get inbox (default) list"""
         try:
-            inbox_list = List.objects.get(
-                user=request.user,
-                is_default=True,
-                soft_deleted=False
-            )
+            inbox_list = self.get_queryset().get(is_default=True)
             serializer = ListSerializer(inbox_list)
             return Response(serializer.data)
         except List.DoesNotExist:
@@ -8,6 +8,8 @@ class TaskAdmin(admin.ModelAdmin):
     list_filter = ['is_completed', 'priority_level', 'color', 'routine_type']
     search_fields = ['title', 'description']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    # user column is rendered per row — join it instead of one query per task
+    list_select_related = ('user',)
 
 
 admin.site.register(Task, TaskAdmin)
\ No newline at end of file
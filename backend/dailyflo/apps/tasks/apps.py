@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.tasks'
+
+    def ready(self):
+        # build the cached serializer field sets at startup rather than on the first request
+        from .serializers import TaskCreateSerializer, TaskDetailSerializer, TaskListSerializer
+
+        for serializer_class in (TaskListSerializer, TaskDetailSerializer, TaskCreateSerializer):
+            serializer_class.warm_fields_cache()
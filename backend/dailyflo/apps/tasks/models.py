@@ -1,8 +1,20 @@
 from django.db import models
+from django.db.models.functions import Now
+from django.utils import timezone
 from django.conf import settings
 import uuid
 
 
+# human-readable priority labels — built once, read per serialized task
+_PRIORITY_MAP = {
+    1: 'Very Low',
+    2: 'Low',
+    3: 'Medium',
+    4: 'High',
+    5: 'Very High',
+}
+
+
 class ActivityLog(models.Model):
     """
     records every user action on tasks (completed, updated, deleted).
@@ -63,6 +75,34 @@ class ActivityLog(models.Model):
         return f"{self.user.email} {self.action_type} '{self.task_title}' at {self.created_at}"
 
 
+class TaskQuerySet(models.QuerySet):
+    """queryset helpers for task endpoints"""
+
+    def for_user(self, user):
+        """the user's live (not soft deleted) tasks — the scope of every task endpoint"""
+        return self.filter(user=user, soft_deleted=False)
+
+    def with_overdue(self):
+        """
+        is_overdue_db: same rule as Task.is_overdue() (open task, due date in the past), evaluated
+        by the database once per query instead of a timezone.now() + method call per row
+        """
+        return self.annotate(
+            is_overdue_db=models.Case(
+                models.When(is_completed=False, due_date__lt=Now(), then=models.Value(True)),
+                default=models.Value(False),
+                output_field=models.BooleanField(),
+            ),
+        )
+
+    def for_list_rows(self):
+        """
+        everything TaskListSerializer reads in one query: the list join, the overdue annotation
+        and only the columns it renders (Task.LIST_FIELDS)
+        """
+        return self.select_related('list').with_overdue().only(*Task.LIST_FIELDS)
+
+
 class Task(models.Model):
     """
     task model for individual tasks
@@ -196,6 +236,15 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = TaskQuerySet.as_manager()
+    
+    # columns TaskListSerializer reads (plus the list join) — for_list_rows() loads only these
+    LIST_FIELDS = (
+        'id', 'title', 'description', 'icon', 'time', 'duration', 'due_date', 'is_completed',
+        'completed_at', 'priority_level', 'color', 'routine_type', 'metadata', 'created_at', 'updated_at',
+        'list', 'list__name', 'list__color',
+    )
+    
     class Meta:
         db_table = 'tasks'
         verbose_name = 'Task'
@@ -203,13 +252,32 @@ class Task(models.Model):
         # database indexes for performance
         indexes = [
             models.Index(fields=['user']),
-            models.Index(fields=['user', 'list']),
-            models.Index(fields=['user', 'is_completed']),
-            models.Index(fields=['user', 'due_date']),
             models.Index(fields=['user', 'priority_level']),
-            models.Index(fields=['user', 'color']),
-            models.Index(fields=['user', 'routine_type']),
-            models.Index(fields=['soft_deleted']),
+            # newest change per user — the etag probe on the task list endpoints
+            models.Index(fields=['user', '-updated_at'], name='tasks_user_updated_idx'),
+            # no (user, color) / (user, routine_type) — a handful of values each, so the planner
+            # never picks them; live tasks per list is the selective path for those filters.
+            # replaces the full (user, list) b-tree — every list lookup also filters soft_deleted
+            models.Index(
+                fields=['user', 'list'],
+                condition=models.Q(soft_deleted=False),
+                name='tasks_live_by_list_idx',
+            ),
+            # list endpoints always filter user + soft_deleted=False, so lead with both.
+            # due_date last: completed / overdue (is_completed=False, due_date < now) are one range scan
+            models.Index(
+                fields=['user', 'soft_deleted', 'is_completed', 'due_date'],
+                name='tasks_user_live_state_due_idx',
+            ),
+            models.Index(fields=['user', 'soft_deleted', 'due_date']),
+            # open, live tasks by due date — the home screen / overdue / today queries. only covers
+            # incomplete rows, so it stays small; replaces the full (user, is_completed) and
+            # (user, due_date) b-trees (every task query also filters soft_deleted)
+            models.Index(
+                fields=['user', 'due_date'],
+                condition=models.Q(soft_deleted=False, is_completed=False),
+                name='tasks_active_due_idx',
+            ),
         ]
         # ordering
         ordering = ['sort_order', 'created_at']
@@ -219,44 +287,55 @@ class Task(models.Model):
     
     def mark_completed(self):
         """mark task as completed"""
-        from django.utils import timezone
-        self.is_completed = True
-        self.completed_at = timezone.now()
-        self.save()
+        self._set_completion(is_completed=True, completed_at=timezone.now())
     
     def mark_incomplete(self):
         """mark task as incomplete"""
-        self.is_completed = False
-        self.completed_at = None
-        self.save()
+        self._set_completion(is_completed=False, completed_at=None)
+    
+    def _set_completion(self, **fields):
+        # write only the completion columns instead of save()'s full-row UPDATE.
+        # update() skips auto_now, so updated_at is set here explicitly
+        fields['updated_at'] = timezone.now()
+        Task.objects.filter(pk=self.pk).update(**fields)
+        # keep the in-memory instance in sync for the serializer response
+        for name, value in fields.items():
+            setattr(self, name, value)
+    
+    # subtasks live in metadata['subtasks'] as [{id, title, isCompleted, sortOrder}] — there is no
+    # subtask table, so counts come from the row that is already loaded (no per-task queries)
+    def _metadata_subtasks(self):
+        subtasks = (self.metadata or {}).get('subtasks')
+        if not isinstance(subtasks, list):
+            return []
+        return [subtask for subtask in subtasks if isinstance(subtask, dict)]
     
     def get_subtasks(self):
         """get all subtasks for this task"""
-        return self.subtasks.filter(soft_deleted=False).order_by('sort_order')
+        return sorted(
+            self._metadata_subtasks(),
+            key=lambda subtask: subtask.get('sortOrder', subtask.get('sort_order')) or 0,
+        )
     
     def get_completed_subtasks_count(self):
         """get count of completed subtasks"""
-        return self.subtasks.filter(soft_deleted=False, is_completed=True).count()
+        # app writes isCompleted; older payloads used is_completed
+        return sum(
+            1 for subtask in self._metadata_subtasks()
+            if subtask.get('isCompleted', subtask.get('is_completed'))
+        )
     
     def get_total_subtasks_count(self):
         """get total count of subtasks"""
-        return self.subtasks.filter(soft_deleted=False).count()
+        return len(self._metadata_subtasks())
     
     def is_overdue(self):
         """check if task is overdue"""
         if not self.due_date or self.is_completed:
             return False
-        from django.utils import timezone
         return timezone.now() > self.due_date
     
     def get_priority_display(self):
         """get human-readable priority level"""
-        priority_map = {
-            1: 'Very Low',
-            2: 'Low',
-            3: 'Medium',
-            4: 'High',
-            5: 'Very High'
-        }
-        return priority_map.get(self.priority_level, 'Medium')
+        return _PRIORITY_MAP.get(self.priority_level, 'Medium')
     
\ No newline at end of file
@@ -1,30 +1,20 @@
 from rest_framework import serializers
+from apps.common.serializers import CachedFieldsMixin
 from .models import Task, ActivityLog
-from apps.lists.models import List
-from apps.lists.serializers import ListSerializer, ListCreateSerializer
 
 
-class TaskListSerializer(serializers.ModelSerializer):
+class TaskListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for listing tasks (minimal data)
+    expects a queryset built with Task.objects.with_overdue()
     """
-    list_name = serializers.SerializerMethodField()
-    list_color = serializers.SerializerMethodField()
-    
-    def get_list_name(self, obj):
-        """safely get list name, handling null lists"""
-        return obj.list.name if obj.list else None
-    
-    def get_list_color(self, obj):
-        """safely get list color, handling null lists"""
-        return obj.list.color if obj.list else None
+    # read off the select_related('list') join; inbox tasks (no list) give null
+    list_name = serializers.CharField(source='list.name', read_only=True, allow_null=True)
+    list_color = serializers.CharField(source='list.color', read_only=True, allow_null=True)
     
     priority_display = serializers.CharField(source='get_priority_display', read_only=True)
-    is_overdue = serializers.SerializerMethodField()
-    
-    def get_is_overdue(self, obj):
-        """get overdue status from model method"""
-        return obj.is_overdue()
+    # annotated by Task.objects.with_overdue()
+    is_overdue = serializers.BooleanField(source='is_overdue_db', read_only=True)
     
     class Meta:
         model = Task
@@ -37,49 +27,39 @@ class TaskListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at', 'completed_at']
 
 
-class TaskDetailSerializer(serializers.ModelSerializer):
+class TaskDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for detailed task view (includes subtasks and reminders)
+    expects a queryset built with Task.objects.with_overdue()
+    list_name / list_color are added in to_representation from one read of the list relation
     """
-    list_name = serializers.SerializerMethodField()
-    list_color = serializers.SerializerMethodField()
-    
-    def get_list_name(self, obj):
-        """safely get list name, handling null lists"""
-        return obj.list.name if obj.list else None
-    
-    def get_list_color(self, obj):
-        """safely get list color, handling null lists"""
-        return obj.list.color if obj.list else None
-    
     priority_display = serializers.CharField(source='get_priority_display', read_only=True)
-    is_overdue = serializers.SerializerMethodField()
-    subtasks_count = serializers.SerializerMethodField()
-    completed_subtasks_count = serializers.SerializerMethodField()
-    
-    def get_is_overdue(self, obj):
-        """get overdue status from model method"""
-        return obj.is_overdue()
+    # annotated by Task.objects.with_overdue(); subtask counts are model methods read through source
+    is_overdue = serializers.BooleanField(source='is_overdue_db', read_only=True)
+    subtasks_count = serializers.IntegerField(source='get_total_subtasks_count', read_only=True)
+    completed_subtasks_count = serializers.IntegerField(source='get_completed_subtasks_count', read_only=True)
     
     class Meta:
         model = Task
         fields = [
             'id', 'title', 'description', 'icon', 'time', 'duration', 'due_date', 'is_completed',
             'completed_at', 'priority_level', 'priority_display', 'color',
-            'routine_type', 'sort_order', 'list', 'list_name', 'list_color',
+            'routine_type', 'sort_order', 'list',
             'is_overdue', 'subtasks_count', 'completed_subtasks_count',
             'metadata', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'completed_at']
     
-    def get_subtasks_count(self, obj):
-        return obj.get_total_subtasks_count()
-    
-    def get_completed_subtasks_count(self, obj):
-        return obj.get_completed_subtasks_count()
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # read off the select_related('list') join once (not once per field); inbox tasks give null
+        task_list = instance.list
+        data['list_name'] = task_list.name if task_list is not None else None
+        data['list_color'] = task_list.color if task_list is not None else None
+        return data
 
 
-class TaskCreateSerializer(serializers.ModelSerializer):
+class TaskCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for creating new tasks
     """
@@ -96,8 +76,8 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         """validate that the list belongs to the current user"""
         user = self.context['request'].user
         
-        # Ensure the list belongs to the authenticated user
-        if value and value.user != user:
+        # Ensure the list belongs to the authenticated user (compare ids — no owner fetch)
+        if value and value.user_id != user.id:
             raise serializers.ValidationError("You can only assign tasks to your own lists.")
         return value
     
@@ -107,7 +87,8 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         
         # Automatically assign the task to the authenticated user
         validated_data['user'] = user
-        return super().create(validated_data)
+        # Task has no m2m fields, so skip ModelSerializer.create's nested-write / m2m handling
+        return Task.objects.create(**validated_data)
 
 
 class TaskUpdateSerializer(serializers.ModelSerializer):
@@ -127,8 +108,8 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
         """validate that the list belongs to the current user"""
         user = self.context['request'].user
         
-        # Ensure the list belongs to the authenticated user
-        if value and value.user != user:
+        # Ensure the list belongs to the authenticated user (compare ids — no owner fetch)
+        if value and value.user_id != user.id:
             raise serializers.ValidationError("You can only assign tasks to your own lists.")
         return value
 
@@ -154,6 +135,22 @@ class TaskCompleteSerializer(serializers.ModelSerializer):
         return instance
 
 
+class TaskBulkDeleteSerializer(serializers.Serializer):
+    """
+    payload for DELETE /tasks/bulk-delete/ — camelCase keys match the app's BulkTaskRequest
+    """
+    taskIds = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+
+
+class TaskBulkUpdateSerializer(TaskBulkDeleteSerializer):
+    """
+    payload for PATCH /tasks/bulk-update/ — task ids plus the completion operation
+    """
+    OPERATION_CHOICES = ['complete', 'incomplete']
+    
+    operation = serializers.ChoiceField(choices=OPERATION_CHOICES)
+
+
 class ActivityLogSerializer(serializers.ModelSerializer):
     """
     read-only serializer for activity log entries.
@@ -0,0 +1,33 @@
+"""
+tests for CachedFieldsMixin on the task serializers — the field set is built once per class,
+but every serializer instance still gets its own bound field objects.
+"""
+
+from __future__ import annotations
+
+from django.test import TestCase
+
+from apps.common.serializers import CachedFieldsMixin
+from apps.tasks.serializers import TaskCreateSerializer, TaskDetailSerializer, TaskListSerializer
+
+
+class CachedFieldsTests(TestCase):
+    def test_instances_get_their_own_bound_fields(self):
+        first, second = TaskListSerializer(), TaskListSerializer()
+
+        self.assertEqual(list(first.fields), list(TaskListSerializer.Meta.fields))
+        self.assertIsNot(first.fields['title'], second.fields['title'])
+        self.assertIs(first.fields['title'].parent, first)
+        self.assertIs(second.fields['title'].parent, second)
+        # the cached originals are never bound themselves
+        self.assertIsNone(TaskListSerializer._fields_cache[TaskListSerializer]['title'].parent)
+
+    def test_field_sets_are_built_at_startup(self):
+        for serializer_class in (TaskListSerializer, TaskDetailSerializer, TaskCreateSerializer):
+            self.assertIn(serializer_class, CachedFieldsMixin._fields_cache)
+
+    def test_cached_fields_still_validate(self):
+        serializer = TaskCreateSerializer(data={'title': '', 'priority_level': 9})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(set(serializer.errors), {'title', 'priority_level'})
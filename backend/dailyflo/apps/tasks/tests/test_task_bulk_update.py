@@ -0,0 +1,71 @@
+"""
+tests for PATCH /tasks/bulk-update/ — completion toggles for many tasks land in one UPDATE,
+scoped to the caller's live tasks, with the same activity logs as the single-task endpoint.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+from apps.tasks.models import ActivityLog, Task
+
+BULK_UPDATE_URL = '/tasks/bulk-update/'
+
+
+class TaskBulkUpdateTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        self.other = CustomUser.objects.create_user(username='o@example.com', email='o@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_complete_many_tasks(self):
+        tasks = [Task.objects.create(user=self.user, title=f't{i}') for i in range(3)]
+        done = Task.objects.create(user=self.user, title='done', is_completed=True)
+        ids = [str(task.pk) for task in tasks] + [str(done.pk)]
+
+        response = self.client.patch(BULK_UPDATE_URL, {'taskIds': ids, 'operation': 'complete'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data'], {'updated': 4, 'failed': 0, 'errors': []})
+        self.assertFalse(Task.objects.filter(is_completed=False).exists())
+        self.assertFalse(Task.objects.filter(completed_at__isnull=True).exclude(pk=done.pk).exists())
+        # the already-completed task isn't logged again
+        self.assertEqual(ActivityLog.objects.filter(action_type='completed').count(), 3)
+
+    def test_incomplete_and_missing_ids(self):
+        mine = Task.objects.create(user=self.user, title='mine', is_completed=True)
+        theirs = Task.objects.create(user=self.other, title='theirs', is_completed=True)
+        missing = uuid.uuid4()
+
+        response = self.client.patch(
+            BULK_UPDATE_URL,
+            {'taskIds': [str(mine.pk), str(theirs.pk), str(missing)], 'operation': 'incomplete'},
+            format='json',
+        )
+
+        self.assertFalse(response.data['success'])
+        self.assertEqual(response.data['data']['updated'], 1)
+        self.assertEqual(
+            {error['taskId'] for error in response.data['data']['errors']}, {str(theirs.pk), str(missing)},
+        )
+        mine.refresh_from_db()
+        theirs.refresh_from_db()
+        self.assertFalse(mine.is_completed)
+        self.assertIsNone(mine.completed_at)
+        self.assertTrue(theirs.is_completed)
+        self.assertEqual(ActivityLog.objects.get().action_type, 'updated')
+
+    def test_rejects_unknown_operation(self):
+        task = Task.objects.create(user=self.user, title='t')
+
+        response = self.client.patch(
+            BULK_UPDATE_URL, {'taskIds': [str(task.pk)], 'operation': 'archive'}, format='json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('operation', response.data)
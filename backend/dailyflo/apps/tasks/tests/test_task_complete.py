@@ -0,0 +1,49 @@
+"""
+tests for PATCH /tasks/<id>/complete/ — the completion toggle writes only the completion
+columns (a targeted update()) rather than a full-row save().
+"""
+
+from __future__ import annotations
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+from apps.tasks.models import ActivityLog, Task
+
+
+class TaskCompleteTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.task = Task.objects.create(user=self.user, title='t', description='keep me')
+
+    def test_complete_then_incomplete(self):
+        before = self.task.updated_at
+
+        response = self.client.patch(f'/tasks/{self.task.pk}/complete/', {'is_completed': True}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['is_completed'])
+        task = Task.objects.get(pk=self.task.pk)
+        self.assertTrue(task.is_completed)
+        self.assertIsNotNone(task.completed_at)
+        self.assertGreater(task.updated_at, before)
+        self.assertEqual(task.description, 'keep me')
+        self.assertEqual(ActivityLog.objects.filter(task=task, action_type='completed').count(), 1)
+
+        self.client.patch(f'/tasks/{self.task.pk}/complete/', {'is_completed': False}, format='json')
+
+        task.refresh_from_db()
+        self.assertFalse(task.is_completed)
+        self.assertIsNone(task.completed_at)
+
+    def test_mark_completed_only_writes_completion_columns(self):
+        with self.assertNumQueries(1) as ctx:
+            self.task.mark_completed()
+
+        sql = ctx.captured_queries[0]['sql']
+        self.assertTrue(sql.startswith('UPDATE'))
+        self.assertNotIn('"title"', sql)
+        self.assertTrue(self.task.is_completed)
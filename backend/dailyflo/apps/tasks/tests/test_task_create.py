@@ -0,0 +1,78 @@
+"""
+tests for POST /tasks/ and /tasks/bulk-create/ — tasks are owned by the requesting user, and the
+list ownership check compares ids instead of loading the list's owner.
+"""
+
+from __future__ import annotations
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+from apps.lists.models import List
+from apps.tasks.models import ActivityLog, Task
+
+TASKS_URL = '/tasks/'
+
+
+class TaskCreateTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        self.other = CustomUser.objects.create_user(username='o@example.com', email='o@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_create_in_own_list(self):
+        work = List.objects.create(user=self.user, name='Work')
+
+        response = self.client.post(TASKS_URL, {'title': 't', 'list': str(work.pk)}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        task = Task.objects.get(pk=response.data['id'])
+        self.assertEqual((task.user_id, task.list_id), (self.user.id, work.id))
+
+    def test_cannot_create_in_someone_elses_list(self):
+        foreign = List.objects.create(user=self.other, name='Theirs')
+
+        response = self.client.post(TASKS_URL, {'title': 't', 'list': str(foreign.pk)}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('list', response.data)
+        self.assertFalse(Task.objects.exists())
+
+
+class TaskBulkCreateTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_bulk_create_inserts_tasks_and_created_logs(self):
+        payload = [{'title': f'task {i}', 'priority_level': 4} for i in range(3)]
+
+        response = self.client.post(f'{TASKS_URL}bulk-create/', payload, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data), 3)
+        tasks = Task.objects.filter(user=self.user)
+        self.assertEqual(sorted(tasks.values_list('title', flat=True)), ['task 0', 'task 1', 'task 2'])
+        self.assertEqual(ActivityLog.objects.filter(user=self.user, action_type='created').count(), 3)
+
+    def test_bulk_create_is_all_or_nothing_on_validation_error(self):
+        response = self.client.post(f'{TASKS_URL}bulk-create/', [{'title': 'ok'}, {'title': ''}], format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Task.objects.exists())
+
+    def test_bulk_create_requires_a_list(self):
+        response = self.client.post(f'{TASKS_URL}bulk-create/', {'title': 'one'}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_bulk_create_rejects_oversized_bodies(self):
+        payload = [{'title': f'task {i}'} for i in range(501)]
+
+        response = self.client.post(f'{TASKS_URL}bulk-create/', payload, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Task.objects.exists())
@@ -0,0 +1,67 @@
+"""
+tests for DELETE /tasks/<id>/ and DELETE /tasks/bulk-delete/ — tasks are soft deleted with
+targeted UPDATEs and every deletion gets a 'deleted' activity log.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+from apps.tasks.models import ActivityLog, Task
+from apps.tasks.views import TaskViewSet
+
+BULK_DELETE_URL = '/tasks/bulk-delete/'
+
+
+class TaskDeleteTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_destroy_soft_deletes_and_logs(self):
+        task = Task.objects.create(user=self.user, title='t', description='keep me')
+
+        # lookup, then UPDATE + log INSERT in one transaction (a savepoint pair inside TestCase)
+        with self.assertNumQueries(5):
+            response = self.client.delete(f'/tasks/{task.pk}/')
+
+        self.assertEqual(response.status_code, 204)
+        task.refresh_from_db()
+        self.assertTrue(task.soft_deleted)
+        self.assertEqual(task.description, 'keep me')
+        self.assertEqual(ActivityLog.objects.get(task=task).action_type, 'deleted')
+        self.assertEqual(self.client.get(f'/tasks/{task.pk}/').status_code, 404)
+
+    def test_destroy_of_already_deleted_row_logs_nothing(self):
+        task = Task.objects.create(user=self.user, title='t')
+        view_instance = Task.objects.get(pk=task.pk)
+        # another request soft deletes the task between this request's lookup and its UPDATE
+        Task.objects.filter(pk=task.pk).update(soft_deleted=True)
+
+        viewset = TaskViewSet()
+        viewset.request = type('Request', (), {'user': self.user})()
+        viewset.perform_destroy(view_instance)
+
+        self.assertFalse(ActivityLog.objects.exists())
+
+    def test_bulk_delete(self):
+        other = CustomUser.objects.create_user(username='o@example.com', email='o@example.com')
+        mine = [Task.objects.create(user=self.user, title=f't{i}') for i in range(2)]
+        theirs = Task.objects.create(user=other, title='theirs')
+        ids = [str(task.pk) for task in mine] + [str(theirs.pk), str(uuid.uuid4())]
+
+        response = self.client.delete(BULK_DELETE_URL, {'taskIds': ids, 'operation': 'delete'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['data']['updated'], response.data['data']['failed']), (2, 2))
+        self.assertEqual(Task.objects.filter(soft_deleted=True).count(), 2)
+        self.assertFalse(Task.objects.get(pk=theirs.pk).soft_deleted)
+        self.assertEqual(
+            sorted(ActivityLog.objects.filter(action_type='deleted').values_list('task_title', flat=True)),
+            ['t0', 't1'],
+        )
@@ -0,0 +1,60 @@
+"""
+tests for GET /tasks/<id>/ — subtask counts are read from metadata['subtasks'] (there is no
+subtask table), so the detail response needs no extra queries.
+"""
+
+from __future__ import annotations
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+from apps.lists.models import List
+from apps.tasks.models import Task
+
+
+class TaskDetailViewTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_subtask_counts_come_from_metadata(self):
+        task = Task.objects.create(user=self.user, title='t', metadata={'subtasks': [
+            {'id': 'a', 'title': 'a', 'isCompleted': True, 'sortOrder': 1},
+            {'id': 'b', 'title': 'b', 'isCompleted': False, 'sortOrder': 0},
+            {'id': 'c', 'title': 'c', 'is_completed': True, 'sortOrder': 2},
+        ]})
+
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/tasks/{task.pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['subtasks_count'], response.data['completed_subtasks_count']), (3, 2))
+        self.assertEqual([subtask['id'] for subtask in task.get_subtasks()], ['b', 'a', 'c'])
+
+    def test_task_without_subtasks(self):
+        task = Task.objects.create(user=self.user, title='t')
+
+        response = self.client.get(f'/tasks/{task.pk}/')
+
+        self.assertEqual((response.data['subtasks_count'], response.data['completed_subtasks_count']), (0, 0))
+
+    def test_list_name_and_color(self):
+        work = List.objects.create(user=self.user, name='Work', color='red')
+        task = Task.objects.create(user=self.user, title='t', list=work)
+        inbox = Task.objects.create(user=self.user, title='i')
+
+        data = self.client.get(f'/tasks/{task.pk}/').data
+        inbox_data = self.client.get(f'/tasks/{inbox.pk}/').data
+
+        self.assertEqual((data['list_name'], data['list_color']), ('Work', 'red'))
+        self.assertEqual((inbox_data['list_name'], inbox_data['list_color']), (None, None))
+
+    def test_put_is_not_allowed(self):
+        task = Task.objects.create(user=self.user, title='t')
+
+        response = self.client.put(f'/tasks/{task.pk}/', {'title': 'new'}, format='json')
+
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(self.client.patch(f'/tasks/{task.pk}/', {'title': 'new'}, format='json').status_code, 200)
@@ -0,0 +1,67 @@
+"""
+tests for conditional GETs on the task row endpoints — an unchanged task set answers
+If-None-Match with a 304, and any write (or a task falling overdue) changes the etag.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+from apps.lists.models import List
+from apps.tasks.models import Task
+
+TASKS_URL = '/tasks/'
+
+
+class TaskEtagTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.task = Task.objects.create(user=self.user, title='t')
+
+    def _etag(self, url=TASKS_URL):
+        return self.client.get(url)['ETag']
+
+    def test_unchanged_tasks_return_304(self):
+        for url in (TASKS_URL, f'{TASKS_URL}today/', f'{TASKS_URL}overdue/', f'{TASKS_URL}inbox/'):
+            with self.subTest(url=url):
+                tag = self._etag(url)
+
+                # just the etag probe — no task query, no serialization
+                with self.assertNumQueries(1):
+                    response = self.client.get(url, HTTP_IF_NONE_MATCH=tag)
+
+                self.assertEqual(response.status_code, 304)
+
+    def test_writes_change_the_etag(self):
+        tag = self._etag()
+
+        self.client.patch(f'{TASKS_URL}{self.task.pk}/complete/', {'is_completed': True}, format='json')
+        completed_tag = self._etag()
+        self.assertNotEqual(completed_tag, tag)
+
+        List.objects.create(user=self.user, name='Work')
+        self.assertNotEqual(self._etag(), completed_tag)
+
+    def test_task_falling_overdue_changes_the_etag(self):
+        # due in the future, then (without touching updated_at) moved into the past
+        self.task.due_date = timezone.now() + timedelta(days=1)
+        self.task.save()
+        tag = self._etag()
+
+        Task.objects.filter(pk=self.task.pk).update(due_date=timezone.now() - timedelta(minutes=1))
+
+        self.assertNotEqual(self._etag(), tag)
+
+    def test_etag_is_per_user(self):
+        other = CustomUser.objects.create_user(username='o@example.com', email='o@example.com')
+        tag = self._etag()
+        self.client.force_authenticate(other)
+
+        self.assertEqual(self.client.get(TASKS_URL, HTTP_IF_NONE_MATCH=tag).status_code, 200)
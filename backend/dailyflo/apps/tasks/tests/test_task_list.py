@@ -0,0 +1,151 @@
+"""
+tests for GET /tasks/ — list name/color come from the list join and is_overdue from a sql
+annotation, so the response is one query however many tasks there are (after the etag probe).
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import time, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.accounts.models import CustomUser
+from apps.lists.models import List
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskListSerializer
+
+TASKS_URL = '/tasks/'
+
+
+class TaskListViewTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='u@example.com', email='u@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_name_and_color_without_extra_queries(self):
+        work = List.objects.create(user=self.user, name='Work', color='red')
+        for i in range(3):
+            Task.objects.create(user=self.user, list=work, title=f'work {i}')
+        Task.objects.create(user=self.user, title='inbox')
+
+        with self.assertNumQueries(2):
+            rows = {row['title']: row for row in self.client.get(TASKS_URL).data}
+
+        self.assertEqual((rows['work 0']['list_name'], rows['work 0']['list_color']), ('Work', 'red'))
+        self.assertIsNone(rows['inbox']['list_name'])
+        self.assertIsNone(rows['inbox']['list_color'])
+
+    def test_is_overdue_matches_model_rule(self):
+        past = timezone.now() - timedelta(days=1)
+        Task.objects.create(user=self.user, title='late', due_date=past)
+        Task.objects.create(user=self.user, title='done late', due_date=past, is_completed=True)
+        Task.objects.create(user=self.user, title='future', due_date=timezone.now() + timedelta(days=1))
+        Task.objects.create(user=self.user, title='undated')
+
+        rows = {row['title']: row['is_overdue'] for row in self.client.get(TASKS_URL).data}
+
+        self.assertEqual(rows, {'late': True, 'done late': False, 'future': False, 'undated': False})
+        for task in Task.objects.with_overdue():
+            self.assertEqual(task.is_overdue_db, task.is_overdue())
+
+    def test_list_selects_only_serialized_columns(self):
+        Task.objects.create(user=self.user, title='t')
+
+        with self.assertNumQueries(2) as ctx:
+            self.client.get(TASKS_URL)
+
+        sql = ctx.captured_queries[-1]['sql']
+        self.assertNotIn('"sort_order"', sql.split(' FROM ')[0])
+        self.assertNotIn('"soft_deleted"', sql.split(' FROM ')[0])
+
+    def test_indent_is_honoured_like_drf_json_renderer(self):
+        Task.objects.create(user=self.user, title='t')
+
+        compact = self.client.get(TASKS_URL).content
+        indented = self.client.get(TASKS_URL, HTTP_ACCEPT='application/json; indent=4').content
+
+        self.assertNotIn(b'\n', compact)
+        self.assertIn(b'\n  ', indented)
+        self.assertEqual(json.loads(indented), json.loads(compact))
+
+    def test_pagination_is_opt_in_and_counts_bare_rows(self):
+        work = List.objects.create(user=self.user, name='Work', color='red')
+        for i in range(3):
+            Task.objects.create(user=self.user, list=work, title=f'work {i}')
+
+        self.assertEqual(len(self.client.get(TASKS_URL).data), 3)
+
+        with self.assertNumQueries(3) as ctx:
+            response = self.client.get(TASKS_URL, {'page': 1, 'page_size': 2})
+
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(len(response.data['results']), 2)
+        count_sql = ctx.captured_queries[1]['sql']
+        self.assertTrue(count_sql.startswith('SELECT COUNT(*)'))
+        self.assertNotIn('CASE', count_sql)
+
+    def test_list_rows_render_like_task_list_serializer(self):
+        # list() builds rows from values() — once rendered they must match the serializer's output
+        work = List.objects.create(user=self.user, name='Work', color='red')
+        Task.objects.create(
+            user=self.user, list=work, title='full', description='d', icon='home', time=time(9, 30),
+            duration=15, due_date=timezone.now() - timedelta(hours=1), priority_level=5,
+            metadata={'subtasks': [{'id': 'a', 'title': 'a', 'isCompleted': False}]},
+        )
+        Task.objects.create(user=self.user, title='inbox')
+
+        listed = self.client.get(TASKS_URL).json()
+        serialized = TaskListSerializer(
+            Task.objects.select_related('list').with_overdue().order_by('-created_at'), many=True,
+        ).data
+
+        self.assertEqual(listed, json.loads(JSONRenderer().render(serialized)))
+
+    def test_filtered_actions_render_like_task_list_serializer(self):
+        work = List.objects.create(user=self.user, name='Work', color='red')
+        Task.objects.create(user=self.user, list=work, title='late', due_date=timezone.now() - timedelta(days=2))
+        Task.objects.create(user=self.user, title='inbox')
+        Task.objects.create(user=self.user, list=work, title='done', is_completed=True)
+        expected = {
+            'today': Task.objects.filter(title='inbox'),
+            'overdue': Task.objects.filter(title='late'),
+            'completed': Task.objects.filter(title='done'),
+            'inbox': Task.objects.filter(title='inbox'),
+        }
+
+        for action, queryset in expected.items():
+            with self.subTest(action=action), self.assertNumQueries(2):
+                listed = self.client.get(f'{TASKS_URL}{action}/').json()
+            serialized = TaskListSerializer(queryset.select_related('list').with_overdue(), many=True).data
+            self.assertEqual(listed, json.loads(JSONRenderer().render(serialized)))
+
+    def test_today_uses_a_range_on_due_date(self):
+        midnight = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        Task.objects.create(user=self.user, title='start of day', due_date=midnight)
+        Task.objects.create(user=self.user, title='end of day', due_date=midnight + timedelta(days=1, microseconds=-1))
+        Task.objects.create(user=self.user, title='tomorrow', due_date=midnight + timedelta(days=1))
+        Task.objects.create(user=self.user, title='yesterday', due_date=midnight - timedelta(microseconds=1))
+        Task.objects.create(user=self.user, title='undated')
+
+        with self.assertNumQueries(2) as ctx:
+            titles = {row['title'] for row in self.client.get(f'{TASKS_URL}today/').data}
+
+        self.assertEqual(titles, {'start of day', 'end of day', 'undated'})
+        self.assertNotIn('django_datetime_cast_date', ctx.captured_queries[-1]['sql'])
+
+    def test_all_param_streams_same_rows(self):
+        work = List.objects.create(user=self.user, name='Work', color='red')
+        for i in range(3):
+            Task.objects.create(user=self.user, list=work, title=f'work {i}')
+        Task.objects.create(user=self.user, title='inbox')
+        regular = self.client.get(TASKS_URL).json()
+
+        response = self.client.get(TASKS_URL, {'all': '1'})
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), regular)
@@ -1,14 +1,17 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from . import views
 
 # create router for ViewSets
+# SimpleRouter, not DefaultRouter: the task list owns /tasks/ so the browsable api-root view
+# would be unreachable, and it would add a second 'api-root' url name plus a .<format>
+# suffix variant of every route for the resolver to walk
 # register with empty string since the main urls.py already includes 'tasks/' prefix
 # this creates endpoints at /tasks/ (list/create) and /tasks/{id}/ (detail)
 # IMPORTANT: register activity-logs BEFORE the empty '' route,
 # otherwise the router matches "activity-logs" as a task UUID and returns 404
 # list CRUD lives under /lists/ (apps.lists.urls), not under /tasks/
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(r'activity-logs', views.ActivityLogViewSet, basename='activity-log')
 router.register(r'', views.TaskViewSet, basename='task')
 
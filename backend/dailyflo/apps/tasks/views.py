@@ -1,13 +1,29 @@
-from datetime import datetime
+import hashlib
+from datetime import datetime, timedelta
 
 from rest_framework import viewsets, status, permissions, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.generics import ListAPIView, RetrieveAPIView, CreateAPIView, UpdateAPIView, DestroyAPIView
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
-from django.db.models import Q
-from .models import Task, ActivityLog
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
+from django.db import transaction
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Now
+from apps.common.pagination import OptionalPageNumberPagination
+from apps.common.streaming import streaming_json_response
+from apps.lists.models import List
+from .models import Task, ActivityLog, _PRIORITY_MAP
+
+
+# rows per INSERT for the bulk endpoints
+_BULK_BATCH_SIZE = 500
+# most tasks one bulk-create request may carry — every item is validated before the transaction
+_BULK_CREATE_MAX = _BULK_BATCH_SIZE
+
+# actions that return TaskListSerializer-shaped rows (built with _task_list_values)
+_LIST_ACTIONS = {'list', 'today', 'overdue', 'completed', 'inbox'}
 
 
 def _parse_occurrence_date(request):
@@ -24,10 +40,75 @@ def _parse_occurrence_date(request):
         return None
 from .serializers import (
     TaskListSerializer, TaskDetailSerializer, TaskCreateSerializer,
-    TaskUpdateSerializer, TaskCompleteSerializer,
+    TaskUpdateSerializer, TaskCompleteSerializer, TaskBulkUpdateSerializer, TaskBulkDeleteSerializer,
     ActivityLogSerializer,
 )
 
+# TaskListSerializer fields that values() reads straight off the row (the rest are derived below)
+_TASK_LIST_VALUES = tuple(
+    f for f in TaskListSerializer.Meta.fields
+    if f not in ('priority_display', 'list_name', 'list_color', 'is_overdue')
+)
+
+
+def _task_list_values(queryset):
+    """
+    TaskListSerializer's keys straight from values(): list name/color off the join,
+    is_overdue from the with_overdue() annotation. finish the rows with _task_list_rows()
+    """
+    return queryset.values(
+        *_TASK_LIST_VALUES,
+        list_name=F('list__name'),
+        list_color=F('list__color'),
+        is_overdue=F('is_overdue_db'),
+    )
+
+
+def _iter_task_list_rows(values):
+    """finish _task_list_values() rows with priority_display (uuid/datetimes left to the encoder)"""
+    for row in values:
+        row['priority_display'] = _PRIORITY_MAP.get(row['priority_level'], 'Medium')
+        yield row
+
+
+def _task_list_rows(values):
+    return list(_iter_task_list_rows(values))
+
+
+def _task_rows_etag(request, *args, **kwargs):
+    """
+    etag for the task row endpoints, from one small query instead of building the payload:
+    - newest task updated_at (every write path sets it, soft deletes included)
+    - newest list updated_at (list renames / recolours / deletes change list_name etc.)
+    - how many open tasks are past due (is_overdue flips as time passes, with no write)
+    - today's date (the today endpoint's window moves at midnight)
+    """
+    tasks = Task.objects.filter(user=OuterRef('pk')).order_by().values('user')
+    lists = List.objects.filter(user=OuterRef('pk')).order_by().values('user')
+    stamps = type(request.user).objects.filter(pk=request.user.pk).values_list(
+        Subquery(tasks.annotate(changed=Max('updated_at')).values('changed')),
+        Subquery(lists.annotate(changed=Max('updated_at')).values('changed')),
+        Subquery(
+            tasks.filter(soft_deleted=False, is_completed=False, due_date__lt=Now())
+            .annotate(overdue=Count('pk')).values('overdue')
+        ),
+    ).get()
+    key = f'{request.user.pk}|{timezone.localdate()}|{stamps}'
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def _bulk_result(task_ids, found_ids):
+    """BulkTaskResponse body: ids that weren't the caller's live tasks are reported as failed"""
+    missing = [str(task_id) for task_id in dict.fromkeys(task_ids) if task_id not in found_ids]
+    return {
+        'success': not missing,
+        'data': {
+            'updated': len(found_ids),
+            'failed': len(missing),
+            'errors': [{'taskId': task_id, 'error': 'Task not found'} for task_id in missing],
+        },
+    }
+
 
 class TaskViewSet(viewsets.ModelViewSet):
     """
@@ -39,6 +120,10 @@ class TaskViewSet(viewsets.ModelViewSet):
     # Require authentication to access tasks
     # Only authenticated users can view, create, update, or delete tasks
     permission_classes = [permissions.IsAuthenticated]
+    # no PUT: the app edits tasks with PATCH only, so full-replace update isn't routed at all
+    http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+    # opt-in: GET /tasks/?page=N returns a page, plain GET /tasks/ still returns every task
+    pagination_class = OptionalPageNumberPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['is_completed', 'color', 'priority_level', 'routine_type', 'list']
     search_fields = ['title', 'description']
@@ -49,10 +134,14 @@ class TaskViewSet(viewsets.ModelViewSet):
         """filter tasks by current user"""
         # Filter tasks by the authenticated user
         # Users can only see their own tasks
-        return Task.objects.filter(
-            user=self.request.user,
-            soft_deleted=False
-        ).select_related('list')
+        queryset = Task.objects.for_user(self.request.user)
+        if self.action in _LIST_ACTIONS:
+            # values() picks the columns and the list join itself
+            return queryset.with_overdue()
+        if self.action == 'destroy':
+            # only the ownership lookup + the title for the activity log
+            return queryset.only('id', 'title')
+        return queryset.select_related('list').with_overdue()
     
     def get_serializer_class(self):
         """return appropriate serializer based on action"""
@@ -65,6 +154,23 @@ class TaskViewSet(viewsets.ModelViewSet):
         else:
             return TaskDetailSerializer
     
+    @method_decorator(etag(_task_rows_etag))
+    def list(self, request, *args, **kwargs):
+        """
+        GET /tasks/ — rows come from values() and go straight to the renderer instead of through
+        TaskListSerializer's per-field attribute walk. same keys as TaskListSerializer
+        (uuid/datetimes encoded by the renderer); keep in step with its Meta.fields.
+        ?all=1 streams the rows from a chunked cursor instead of building the whole body in memory.
+        """
+        values = _task_list_values(self.filter_queryset(self.get_queryset()))
+        if request.query_params.get('all') == '1':
+            return streaming_json_response(_iter_task_list_rows(values.iterator(chunk_size=1000)))
+        page = self.paginate_queryset(values)
+        rows = _task_list_rows(values if page is None else page)
+        if page is not None:
+            return self.get_paginated_response(rows)
+        return Response(rows)
+    
     def perform_create(self, serializer):
         """create task with current user and log the creation."""
         task = serializer.save(user=self.request.user)
@@ -111,18 +217,114 @@ class TaskViewSet(viewsets.ModelViewSet):
         task_title is snapshotted now because after soft-delete the task title is still accessible
         but we store it explicitly so the log survives even a future hard-delete.
         """
-        task_title = instance.title
+        # soft delete: keeps the row in the DB so the activity log FK stays valid.
+        # a targeted UPDATE of the two columns rather than save()'s full-row rewrite; the flag and
+        # its log commit together, and a concurrent delete that already flipped it logs nothing
+        with transaction.atomic():
+            deleted = Task.objects.filter(pk=instance.pk, soft_deleted=False).update(
+                soft_deleted=True, updated_at=timezone.now(),
+            )
+            if deleted:
+                ActivityLog.objects.create(
+                    user=self.request.user,
+                    task=instance,
+                    action_type='deleted',
+                    task_title=instance.title,
+                )
 
-        # soft delete: keeps the row in the DB so the activity log FK stays valid
-        instance.soft_deleted = True
-        instance.save()
+    @action(detail=False, methods=['post'], url_path='bulk-create')
+    def bulk_create(self, request):
+        """
+        create many tasks from a json array in batched INSERTs (offline queue sync) —
+        same validation as POST /tasks/, but no per-task save() round trip; 'created' logs are batched too
+        """
+        if not isinstance(request.data, list):
+            return Response({'error': 'Expected a list of tasks'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(request.data) > _BULK_CREATE_MAX:
+            return Response(
+                {'error': f'At most {_BULK_CREATE_MAX} tasks per request'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = TaskCreateSerializer(data=request.data, many=True, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
 
-        ActivityLog.objects.create(
-            user=self.request.user,
-            task=instance,
-            action_type='deleted',
-            task_title=task_title,
-        )
+        with transaction.atomic():
+            tasks = Task.objects.bulk_create(
+                [Task(user=request.user, **data) for data in serializer.validated_data],
+                batch_size=_BULK_BATCH_SIZE,
+            )
+            ActivityLog.objects.bulk_create(
+                [
+                    ActivityLog(user=request.user, task=task, action_type='created', task_title=task.title)
+                    for task in tasks
+                ],
+                batch_size=_BULK_BATCH_SIZE,
+            )
+        return Response(TaskCreateSerializer(tasks, many=True).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['patch'], url_path='bulk-update')
+    def bulk_update(self, request):
+        """
+        complete / incomplete many tasks in one transaction (offline queue sync) —
+        one UPDATE for the whole batch instead of a request + commit per toggle.
+        logs match the single-task path: 'completed' on completion, 'updated' when reopened.
+        """
+        serializer = TaskBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        task_ids = serializer.validated_data['taskIds']
+        is_completed = serializer.validated_data['operation'] == 'complete'
+
+        now = timezone.now()
+        with transaction.atomic():
+            found = list(
+                Task.objects.for_user(request.user).filter(pk__in=task_ids)
+                .values_list('pk', 'title', 'is_completed')
+            )
+            # tasks already in the requested state count as updated but aren't rewritten or logged
+            changing = [(pk, title) for pk, title, completed in found if completed != is_completed]
+            Task.objects.filter(pk__in=[pk for pk, _ in changing]).update(
+                is_completed=is_completed,
+                completed_at=now if is_completed else None,
+                updated_at=now,
+            )
+            ActivityLog.objects.bulk_create(
+                [
+                    ActivityLog(
+                        user=request.user,
+                        task_id=pk,
+                        action_type='completed' if is_completed else 'updated',
+                        task_title=title,
+                    )
+                    for pk, title in changing
+                ],
+                batch_size=_BULK_BATCH_SIZE,
+            )
+
+        return Response(_bulk_result(task_ids, {pk for pk, _, _ in found}))
+
+    @action(detail=False, methods=['delete'], url_path='bulk-delete')
+    def bulk_delete(self, request):
+        """soft delete many tasks with one UPDATE and batched 'deleted' logs, in one transaction"""
+        serializer = TaskBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        task_ids = serializer.validated_data['taskIds']
+
+        with transaction.atomic():
+            found = list(
+                Task.objects.for_user(request.user).filter(pk__in=task_ids).values_list('pk', 'title')
+            )
+            Task.objects.filter(pk__in=[pk for pk, _ in found]).update(
+                soft_deleted=True, updated_at=timezone.now(),
+            )
+            ActivityLog.objects.bulk_create(
+                [
+                    ActivityLog(user=request.user, task_id=pk, action_type='deleted', task_title=title)
+                    for pk, title in found
+                ],
+                batch_size=_BULK_BATCH_SIZE,
+            )
+
+        return Response(_bulk_result(task_ids, {pk for pk, _ in found}))
 
     @action(detail=True, methods=['patch'])
     def complete(self, request, pk=None):
@@ -152,42 +354,45 @@ class TaskViewSet(viewsets.ModelViewSet):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     @action(detail=False, methods=['get'])
+    @method_decorator(etag(_task_rows_etag))
     def today(self, request):
         """get today's tasks"""
-        today = timezone.now().date()
+        # a half-open range on the raw column (indexable) instead of due_date__date=today,
+        # which wraps due_date in a date cast; midnight in the current timezone like __date
+        start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
         tasks = self.get_queryset().filter(
-            Q(due_date__date=today) | Q(due_date__isnull=True)
-        ).exclude(is_completed=True)
+            Q(due_date__gte=start, due_date__lt=start + timedelta(days=1)) | Q(due_date__isnull=True),
+            is_completed=False,
+        )
         
-        serializer = TaskListSerializer(tasks, many=True)
-        return Response(serializer.data)
+        return Response(_task_list_rows(_task_list_values(tasks)))
     
     @action(detail=False, methods=['get'])
+    @method_decorator(etag(_task_rows_etag))
     def overdue(self, request):
         """get overdue tasks"""
-        now = timezone.now()
+        # database clock, same as the is_overdue annotation — no per-request literal in the sql
         tasks = self.get_queryset().filter(
-            due_date__lt=now,
+            due_date__lt=Now(),
             is_completed=False
         )
         
-        serializer = TaskListSerializer(tasks, many=True)
-        return Response(serializer.data)
+        return Response(_task_list_rows(_task_list_values(tasks)))
     
     @action(detail=False, methods=['get'])
+    @method_decorator(etag(_task_rows_etag))
     def completed(self, request):
         """get completed tasks"""
         tasks = self.get_queryset().filter(is_completed=True)
         
-        serializer = TaskListSerializer(tasks, many=True)
-        return Response(serializer.data)
+        return Response(_task_list_rows(_task_list_values(tasks)))
 
     @action(detail=False, methods=['get'])
+    @method_decorator(etag(_task_rows_etag))
     def inbox(self, request):
         """inbox tasks: no list assigned, not completed, not soft-deleted (get_queryset already excludes soft-deleted)"""
         tasks = self.get_queryset().filter(list__isnull=True, is_completed=False)
-        serializer = TaskListSerializer(tasks, many=True)
-        return Response(serializer.data)
+        return Response(_task_list_rows(_task_list_values(tasks)))
 
 
 class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
@@ -109,6 +109,14 @@ DATABASES = {
 
 AUTH_USER_MODEL = 'accounts.CustomUser'
 
+# users sign in with their email (case-insensitive); username is only kept for social accounts.
+# ModelBackend stays second so createsuperuser / create_user(username=...) accounts can still
+# sign in to /admin/ with their username
+AUTHENTICATION_BACKENDS = [
+    'apps.accounts.backends.EmailBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -153,7 +161,12 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
-    )
+    ),
+    # orjson-backed json (same output as drf's JSONRenderer); browsable api kept for dev
+    'DEFAULT_RENDERER_CLASSES': (
+        'apps.common.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
 # jwt lifetimes + rotation: old refresh tokens go to blacklist so they cannot be reused